@@ -10,19 +10,38 @@ st.set_page_config(
 )
 
 # Load custom CSS
-try:
-    with open("assets/style.css", "r") as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
-except Exception:
-    pass
+@st.cache_resource(show_spinner=False)
+def _load_css() -> str:
+    """Stylesheet contents, read from disk once per process."""
+    try:
+        return Path("assets/style.css").read_text()
+    except Exception:
+        return ""
+
+
+css = _load_css()
+if css:
+    st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
 
 from src.database import init_db
 from src.logging_utils import init_logging, log_once
 
+# Constants
+UPLOAD_DIR = Path("data/uploads")
+
+
+@st.cache_resource(show_spinner=False)
+def _bootstrap():
+    """Process-wide setup; runs once per server process, not on every rerun."""
+    init_db()
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    ui_logger = init_logging("ui")
+    log_once(ui_logger, "ui_started", "Streamlit UI started.")
+    return ui_logger
+
+
 # Initialize
-init_db()
-logger = init_logging("ui")
-log_once(logger, "ui_started", "Streamlit UI started.")
+logger = _bootstrap()
 
 # Import UI components
 from src.ui.components.header import render_header
@@ -33,40 +52,56 @@ from src.ui.components.accounts import render_accounts_tab
 from src.ui.components.settings import render_settings_tab
 from src.ui.components.logs import render_logs_tab
 
-# Constants
-UPLOAD_DIR = Path("data/uploads")
-UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-
 # --- Main ---
 
 render_header()
 
 # Load data
-from src.database import get_queue, get_uploaded_count, get_uploaded_items
-queue_data = get_queue()
-uploaded_count = get_uploaded_count()
-uploaded_rows = get_uploaded_items(200)
+from src.ui.cache import cached_queue, cached_uploaded_count
 
 # Platform status
 render_platform_status(logger)
 
-# Tabs
-tabs = st.tabs(["Dashboard", "Queue", "Accounts", "Settings", "Logs"])
+# Each section is its own page, so a rerun only executes the page being viewed.
+# Pages are also fragments so widget interactions inside them only rerun that page body.
+# Data is loaded inside the fragment so partial reruns see fresh values.
+@st.fragment
+def _dashboard_tab():
+    render_dashboard_tab(cached_uploaded_count(), logger)
 
-with tabs[0]:
-    render_dashboard_tab(queue_data, uploaded_count, logger)
 
-with tabs[1]:
-    render_queue_tab(queue_data, uploaded_rows, UPLOAD_DIR, logger)
+@st.fragment
+def _queue_tab():
+    render_queue_tab(cached_queue(), UPLOAD_DIR, logger)
 
-with tabs[2]:
+
+@st.fragment
+def _accounts_tab():
     render_accounts_tab(logger)
 
-with tabs[3]:
+
+@st.fragment
+def _settings_tab():
     render_settings_tab(logger)
 
-with tabs[4]:
+
+@st.fragment
+def _logs_tab():
     render_logs_tab()
 
+
+# Navigation
+page = st.navigation(
+    [
+        st.Page(_dashboard_tab, title="Dashboard", url_path="dashboard", default=True),
+        st.Page(_queue_tab, title="Queue", url_path="queue"),
+        st.Page(_accounts_tab, title="Accounts", url_path="accounts"),
+        st.Page(_settings_tab, title="Settings", url_path="settings"),
+        st.Page(_logs_tab, title="Logs", url_path="logs"),
+    ],
+    position="top",
+)
+page.run()
+
 # Footer
 st.caption("Social Scheduler  |  Raspberry Pi 5")
@@ -1,21 +1,25 @@
 import json
 import os
+import queue
+import threading
 import time
 import random 
 from datetime import datetime, time as dtime, timedelta
 
-import pytz
 import schedule
 
 from src.database import (
     get_config,
+    get_configs,
     get_due_queue,
-    get_queue,
+    get_pending_queue,
+    get_queue_status_counts,
     increment_attempts,
     init_db,
     set_config,
     update_queue_status,
     reschedule_queue_item,
+    reset_processing_to_pending,
     archive_uploaded_item,
 )
 from src.logging_utils import init_logging, log_once
@@ -24,7 +28,7 @@ from src.platform_registry import get_platforms
 from src.auth_utils import verify_youtube_credentials
 from src.platforms import instagram as instagram_platform
 from src.platforms import tiktok as tiktok_platform
-from src.scheduling import get_schedule, next_daily_slots
+from src.scheduling import get_schedule, get_timezone, next_daily_slots
 
 logger = init_logging("worker")
 
@@ -34,17 +38,64 @@ FORCE_KEY = "queue_force_run"
 FORCE_PLATFORM_KEY = "queue_force_platform"
 TOKEN_CHECK_KEY = "last_token_check_date"
 TOKEN_CHECK_TIME = dtime(hour=8, minute=0)
+MIN_IDLE_SECONDS = 0.5
+MAX_IDLE_SECONDS = 30
+# Messages queued within this window go out as one Telegram message
+NOTIFY_COALESCE_SECONDS = 1.0
+
+_NOTIFY_QUEUE: "queue.Queue[str]" = queue.Queue()
+_NOTIFY_THREAD: threading.Thread | None = None
+_NOTIFY_LOCK = threading.Lock()
+# Global per-platform overrides from Settings: platform -> (title key, description key)
+PLATFORM_OVERRIDE_KEYS = {
+    "youtube": ("youtube_title_override", "youtube_desc_override"),
+    "instagram": (None, "instagram_desc_override"),
+    "tiktok": (None, "tiktok_desc_override"),
+}
+# Settings process_video() needs, read together once per tick (key -> default)
+VIDEO_CONFIG_DEFAULTS = {
+    "global_title": "Short",
+    "global_desc": "",
+    "staged_uploads_enabled": "0",
+    "staged_upload_test_platform": "youtube",
+    "youtube_title_override": "",
+    "youtube_desc_override": "",
+    "instagram_desc_override": "",
+    "tiktok_desc_override": "",
+}
 
 
 def _now_with_timezone() -> datetime:
-    tz_name = get_schedule()["timezone"]
-    tz = pytz.timezone(tz_name)
+    # Called once per tick; callers receive `now` rather than recomputing it
+    tz = get_timezone(get_schedule()["timezone"])
     return datetime.now(tz)
 
 
+def _notification_sender() -> None:
+    """Drain the notify queue forever, batching bursts into a single Telegram send."""
+    while True:
+        batch = [_NOTIFY_QUEUE.get()]
+        deadline = time.monotonic() + NOTIFY_COALESCE_SECONDS
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                batch.append(_NOTIFY_QUEUE.get(timeout=remaining))
+            except queue.Empty:
+                break
+        try:
+            send_telegram_message("\n\n".join(batch))
+        except Exception as exc:
+            logger.warning("Failed to deliver notification: %s", exc)
+
+
 def _notify(message: str) -> None:
+    """Log now; send to Telegram from a background thread so uploads never wait on HTTP."""
+    global _NOTIFY_THREAD
     logger.info(message)
-    send_telegram_message(message)
+    with _NOTIFY_LOCK:
+        if _NOTIFY_THREAD is None:
+            _NOTIFY_THREAD = threading.Thread(target=_notification_sender, name="notifier", daemon=True)
+            _NOTIFY_THREAD.start()
+    _NOTIFY_QUEUE.put(message)
 
 
 def warn_tiktok_session_if_needed() -> None:
@@ -117,7 +168,7 @@ def _pull_queue_forward(now: datetime) -> None:
     available daily slots starting now (preserving one-per-day constraint).
     """
     try:
-        pending = [row for row in get_queue(limit=200) if row.get("status") in ("pending", "retry")]
+        pending = get_pending_queue(limit=200)
         if not pending:
             return
 
@@ -150,20 +201,38 @@ def reset_stale_tasks():
     This prevents items from getting stuck forever if the container dies during upload.
     """
     try:
-        # Get all tasks, filter manually or rely on DB status
-        all_items = get_queue(limit=1000)
-        stale_tasks = [r for r in all_items if r["status"] == "processing"]
-        
-        if stale_tasks:
-            logger.warning(f"Found {len(stale_tasks)} stale 'processing' tasks on startup. Resetting to 'pending'.")
-            for task in stale_tasks:
-                # Keep logs, just reset status so it tries again
-                update_queue_status(task["id"], "pending", None, task.get("platform_logs"))
+        # One UPDATE; platform_logs are left untouched so retries skip finished platforms
+        reset_count = reset_processing_to_pending()
+        if reset_count:
+            logger.warning(f"Found {reset_count} stale 'processing' tasks on startup. Reset to 'pending'.")
     except Exception as e:
         logger.error(f"Failed to reset stale tasks: {e}")
 
 
-def process_video(video: dict, forced_platforms: set[str] | None = None) -> None:
+def _json_column(raw, expected: type):
+    """
+    Decode a JSON text column from a queue row. Already-decoded values pass through;
+    returns None when the column is empty, malformed, or not of the expected type.
+    """
+    if isinstance(raw, str) and raw:
+        try:
+            raw = json.loads(raw)
+        except json.JSONDecodeError:
+            return None
+    return raw if isinstance(raw, expected) else None
+
+
+def _connected_platforms(platforms: dict) -> dict[str, bool]:
+    """Probe each platform's connection once; reused for every video in a tick."""
+    return {key: bool(cfg["connected"]()) for key, cfg in platforms.items()}
+
+
+def process_video(
+    video: dict,
+    forced_platforms: set[str] | None = None,
+    connected: dict[str, bool] | None = None,
+    config: dict | None = None,
+) -> None:
     queue_id = video["id"]
     file_path = video["file_path"]
     forced_platforms = set(forced_platforms or [])
@@ -174,26 +243,16 @@ def process_video(video: dict, forced_platforms: set[str] | None = None) -> None
         return
 
     # 1. Parse previous logs to prevent double-uploading on retry
-    raw_logs = video.get("platform_logs")
-    previous_logs = {}
-    if isinstance(raw_logs, str) and raw_logs:
-        try:
-            previous_logs = json.loads(raw_logs)
-        except json.JSONDecodeError:
-            pass
-    elif isinstance(raw_logs, dict):
-        previous_logs = raw_logs
+    previous_logs = _json_column(video.get("platform_logs"), dict) or {}
 
     # 2. Parse enabled platforms for this specific video (if set)
     enabled_platforms_for_video = None
     raw_enabled = video.get("enabled_platforms")
     if raw_enabled:
+        enabled_list = _json_column(raw_enabled, list)
         try:
-            if isinstance(raw_enabled, str):
-                enabled_platforms_for_video = set(json.loads(raw_enabled))
-            elif isinstance(raw_enabled, list):
-                enabled_platforms_for_video = set(raw_enabled)
-        except (json.JSONDecodeError, TypeError):
+            enabled_platforms_for_video = set(enabled_list)
+        except TypeError:
             logger.warning("Failed to parse enabled_platforms for queue #%s", queue_id)
 
     # 3. Increment attempts immediately
@@ -204,39 +263,50 @@ def process_video(video: dict, forced_platforms: set[str] | None = None) -> None
     # Update status to processing so other workers don't grab it (if you scale later)
     update_queue_status(queue_id, "processing", None, previous_logs)
 
-    # 4. File Integrity Check
-    if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
+    # 4. File Integrity Check - one stat covers both "missing" and "empty"
+    try:
+        file_size = os.stat(file_path).st_size
+    except OSError:
+        file_size = 0
+    if file_size == 0:
         msg = f"File missing or empty for queue #{queue_id}: {file_path}"
         update_queue_status(queue_id, "failed", msg, {"error": msg})
         _notify(msg)
         return
 
+    if config is None:
+        config = get_configs(VIDEO_CONFIG_DEFAULTS)
+
     # Get base title and description
-    base_title = video.get("title") or get_config("global_title", "Short")
-    base_description = video.get("description") or get_config("global_desc", "")
+    base_title = video.get("title") or config["global_title"]
+    base_description = video.get("description") or config["global_desc"]
 
     # Parse platform-specific overrides from video (if any)
     video_platform_overrides = {}
     raw_overrides = video.get("platform_overrides")
     if raw_overrides:
-        try:
-            if isinstance(raw_overrides, str):
-                video_platform_overrides = json.loads(raw_overrides)
-            elif isinstance(raw_overrides, dict):
-                video_platform_overrides = raw_overrides
-        except (json.JSONDecodeError, TypeError):
+        video_platform_overrides = _json_column(raw_overrides, dict)
+        if video_platform_overrides is None:
+            video_platform_overrides = {}
             logger.warning("Failed to parse platform_overrides for queue #%s", queue_id)
 
     current_logs = previous_logs.copy()
+    # Platforms that already succeeded in a previous attempt, classified once up front
+    already_uploaded = {
+        key for key, status in previous_logs.items()
+        if "success" in str(status).lower() or "uploaded id" in str(status).lower()
+    }
     failures = []
     successes = []
     missing_accounts = []
     platforms = get_platforms()
     platform_items = list(platforms.items())
+    if connected is None:
+        connected = _connected_platforms(platforms)
 
     # Check if staged uploads are enabled
-    staged_uploads_enabled = bool(int(get_config("staged_uploads_enabled", "0") or "0"))
-    test_platform_key = get_config("staged_upload_test_platform", "youtube")
+    staged_uploads_enabled = bool(int(config["staged_uploads_enabled"] or "0"))
+    test_platform_key = config["staged_upload_test_platform"]
 
     # If staged uploads enabled, upload to test platform first
     if staged_uploads_enabled and test_platform_key in platforms:
@@ -254,7 +324,14 @@ def process_video(video: dict, forced_platforms: set[str] | None = None) -> None
 
     # 5. Process Platforms
     staged_test_failed = False
+    uploads_attempted = 0
+    # Platforms that should have been attempted (enabled for this video and connected),
+    # counted here before any of the skips below
+    total_platforms_to_try = 0
     for idx, (key, cfg) in enumerate(platform_items):
+        if connected.get(key) and (enabled_platforms_for_video is None or key in enabled_platforms_for_video):
+            total_platforms_to_try += 1
+
         # If staged uploads and test platform failed, skip remaining platforms
         if staged_uploads_enabled and staged_test_failed and idx > 0:
             logger.info("Skipping %s for #%s (staged test platform failed)", cfg["label"], queue_id)
@@ -273,13 +350,12 @@ def process_video(video: dict, forced_platforms: set[str] | None = None) -> None
         label = cfg["label"]
 
         # SKIP if already succeeded in a previous attempt
-        prev_status = current_logs.get(key, "")
-        if "success" in str(prev_status).lower() or "uploaded id" in str(prev_status).lower():
+        if key in already_uploaded:
             logger.info("Skipping %s for #%s (already uploaded).", label, queue_id)
             successes.append(label)
             continue
 
-        if not cfg["connected"]():
+        if not connected.get(key):
             reason = f"{label} not connected."
             current_logs[key] = reason
             missing_accounts.append(label)
@@ -294,8 +370,10 @@ def process_video(video: dict, forced_platforms: set[str] | None = None) -> None
             # CONTINUE to other platforms instead of stopping
             continue
 
-        # Add Jitter (wait 10-30 seconds between platforms to avoid bot detection)
-        time.sleep(random.uniform(10, 30))
+        # Add Jitter (wait 10-30 seconds between platforms to avoid bot detection).
+        # Only needed between uploads, so a single-platform run starts right away.
+        if uploads_attempted:
+            time.sleep(random.uniform(10, 30))
 
         # Get platform-specific title/description
         # Priority: video-specific override > global platform override > base title/description
@@ -310,24 +388,15 @@ def process_video(video: dict, forced_platforms: set[str] | None = None) -> None
             if "description" in overrides and overrides["description"]:
                 platform_description = overrides["description"]
         else:
-            # Fall back to global platform overrides from settings
-            if key == "youtube":
-                yt_title_override = get_config("youtube_title_override", "")
-                yt_desc_override = get_config("youtube_desc_override", "")
-                if yt_title_override:
-                    platform_title = yt_title_override
-                if yt_desc_override:
-                    platform_description = yt_desc_override
-            elif key == "instagram":
-                ig_desc_override = get_config("instagram_desc_override", "")
-                if ig_desc_override:
-                    platform_description = ig_desc_override
-            elif key == "tiktok":
-                tt_desc_override = get_config("tiktok_desc_override", "")
-                if tt_desc_override:
-                    platform_description = tt_desc_override
+            # Fall back to global platform overrides from settings (prefetched with the tick's config)
+            title_key, desc_key = PLATFORM_OVERRIDE_KEYS.get(key, (None, None))
+            if title_key and config[title_key]:
+                platform_title = config[title_key]
+            if desc_key and config[desc_key]:
+                platform_description = config[desc_key]
 
         uploader = cfg["uploader"]
+        uploads_attempted += 1
         try:
             if key == "youtube":
                 ok, message = uploader(file_path, platform_title, platform_description)
@@ -355,16 +424,9 @@ def process_video(video: dict, forced_platforms: set[str] | None = None) -> None
             # CONTINUE to other platforms instead of stopping (unless staged test failed)
 
     # 6. Determine Final Status
-    # Count total platforms that should have been attempted
-    total_platforms_to_try = 0
-    for key, cfg in platforms.items():
-        if enabled_platforms_for_video is not None and key not in enabled_platforms_for_video:
-            continue
-        if cfg["connected"]():
-            total_platforms_to_try += 1
-
-    # Calculate pending queue count
-    pending_count = len([r for r in get_queue(limit=500) if r.get("status") in ("pending", "retry")])
+    # Calculate pending queue count - aggregated in SQL
+    counts = get_queue_status_counts()
+    pending_count = counts.get("pending", 0) + counts.get("retry", 0)
 
     # Determine if this upload should be considered successful
     has_any_success = len(successes) > 0
@@ -433,10 +495,12 @@ def check_and_post():
         logger.debug("Worker is busy, skipping schedule tick.")
         return
 
-    paused = bool(int(get_config(PAUSE_KEY, 0) or 0))
-    force = bool(int(get_config(FORCE_KEY, 0) or 0))
-    force_platform = (get_config(FORCE_PLATFORM_KEY, "") or "").strip()
-    if force_platform and force_platform not in get_platforms():
+    flags = get_configs({PAUSE_KEY: 0, FORCE_KEY: 0, FORCE_PLATFORM_KEY: ""})
+    paused = bool(int(flags[PAUSE_KEY] or 0))
+    force = bool(int(flags[FORCE_KEY] or 0))
+    force_platform = (flags[FORCE_PLATFORM_KEY] or "").strip()
+    platforms = get_platforms()
+    if force_platform and force_platform not in platforms:
         force_platform = ""
     if paused and not force:
         logger.debug("Queue paused; skipping tick.")
@@ -447,8 +511,7 @@ def check_and_post():
         due = get_due_queue(now.isoformat())
         if not due and force:
             # If forcing and nothing is strictly due, pick the earliest pending/retry
-            pending = [row for row in get_queue(limit=200) if row.get("status") in ("pending", "retry")]
-            due = pending[:1] if pending else []
+            due = get_pending_queue(limit=1)
         if force:
             set_config(FORCE_KEY, 0)
             set_config(FORCE_PLATFORM_KEY, "")
@@ -457,6 +520,10 @@ def check_and_post():
             logger.debug("No videos due at %s", now.isoformat())
             return
 
+        # Connection state and settings are read once per tick, not per video and platform
+        connected = _connected_platforms(platforms)
+        config = get_configs(VIDEO_CONFIG_DEFAULTS)
+
         for video in due:
             # Check if status is still pending (in case of race conditions if multiple workers exist)
             if video.get('status') not in ('pending', 'retry'):
@@ -464,7 +531,7 @@ def check_and_post():
 
             logger.info("Processing queue item %s.", video["id"])
             platforms_to_run = {force_platform} if force_platform else None
-            process_video(video, platforms_to_run)
+            process_video(video, platforms_to_run, connected, config)
             
             # Add delay between different videos too
             time.sleep(random.uniform(5, 15))
@@ -488,7 +555,11 @@ def main():
     schedule.every(1).minutes.do(check_and_post)
     while True:
         schedule.run_pending()
-        time.sleep(5)
+        # Sleep until the next job is due instead of waking every few seconds
+        idle = schedule.idle_seconds()
+        if idle is None:
+            idle = MAX_IDLE_SECONDS
+        time.sleep(min(max(idle, MIN_IDLE_SECONDS), MAX_IDLE_SECONDS))
 
 
 if __name__ == "__main__":
@@ -1,11 +1,20 @@
 import json
 import os
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 DB_FILE = "data/scheduler.db"
 
+# Per-connection tuning. WAL itself is persisted in the file by init_db().
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=134217728",
+)
+
 
 def _ensure_db_dir() -> None:
     os.makedirs(os.path.dirname(DB_FILE), exist_ok=True)
@@ -15,12 +24,37 @@ def get_conn() -> sqlite3.Connection:
     _ensure_db_dir()
     conn = sqlite3.connect(DB_FILE, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
 
+# One connection per process (UI server or worker), reused by every helper below
+# instead of reconnecting and re-running the pragmas on each call. The lock
+# serializes access because Streamlit runs sessions on separate threads.
+_CONN: Optional[sqlite3.Connection] = None
+_CONN_LOCK = threading.RLock()
+
+
+@contextmanager
+def _connection() -> Iterator[sqlite3.Connection]:
+    global _CONN
+    with _CONN_LOCK:
+        if _CONN is None:
+            _CONN = get_conn()
+        try:
+            yield _CONN
+            _CONN.commit()
+        except Exception:
+            _CONN.rollback()
+            raise
+
+
 def init_db() -> None:
     _ensure_db_dir()
     conn = get_conn()
+    # WAL lets the UI read while the worker writes (and vice versa).
+    conn.execute("PRAGMA journal_mode=WAL")
     cur = conn.cursor()
 
     cur.execute(
@@ -63,6 +97,7 @@ def init_db() -> None:
     conn.commit()
     _ensure_uploads_table(conn)
     _ensure_queue_columns(conn)
+    _ensure_queue_indexes(conn)
     _migrate_uploaded_rows(conn)
     conn.close()
 
@@ -88,6 +123,16 @@ def _ensure_queue_columns(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
+def _ensure_queue_indexes(conn: sqlite3.Connection) -> None:
+    """
+    Index status + scheduled_for so status counts and next-up lookups are range scans.
+    """
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_queue_status_sched ON queue(status, scheduled_for)"
+    )
+    conn.commit()
+
+
 def _ensure_uploads_table(conn: sqlite3.Connection) -> None:
     """
     New table to store completed uploads separately from the active queue.
@@ -141,22 +186,49 @@ def _migrate_uploaded_rows(conn: sqlite3.Connection) -> None:
 
 
 def set_config(key: str, value: Any) -> None:
-    conn = get_conn()
-    conn.execute(
-        "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
-        (key, str(value)),
-    )
-    conn.commit()
-    conn.close()
+    with _connection() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+            (key, str(value)),
+        )
+
+
+def set_configs(values: Dict[str, Any]) -> None:
+    """
+    Write several settings in one transaction.
+    """
+    if not values:
+        return
+    with _connection() as conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+            [(key, str(value)) for key, value in values.items()],
+        )
 
 
 def get_config(key: str, default: Optional[Any] = None) -> Optional[str]:
-    conn = get_conn()
-    row = conn.execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
-    conn.close()
+    with _connection() as conn:
+        row = conn.execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
     return row["value"] if row else default
 
 
+def get_configs(defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Read several settings in one query. `defaults` maps each key to the value
+    returned when it is not set, mirroring get_config(key, default).
+    """
+    if not defaults:
+        return {}
+    keys = list(defaults)
+    placeholders = ", ".join("?" for _ in keys)
+    with _connection() as conn:
+        rows = conn.execute(
+            f"SELECT key, value FROM settings WHERE key IN ({placeholders})", keys
+        ).fetchall()
+    found = {row["key"]: row["value"] for row in rows}
+    return {key: found.get(key, default) for key, default in defaults.items()}
+
+
 def set_json_config(key: str, payload: Dict[str, Any]) -> None:
     set_config(key, json.dumps(payload))
 
@@ -180,18 +252,16 @@ def add_to_queue(
     enabled_platforms: Optional[str] = None,
     platform_overrides: Optional[str] = None,
 ) -> int:
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        INSERT INTO queue (file_path, scheduled_for, title, description, enabled_platforms, platform_overrides)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        (file_path, scheduled_for, title, description, enabled_platforms, platform_overrides),
-    )
-    conn.commit()
-    vid = cur.lastrowid
-    conn.close()
+    with _connection() as conn:
+        cur = conn.cursor()
+        cur.execute(
+            """
+            INSERT INTO queue (file_path, scheduled_for, title, description, enabled_platforms, platform_overrides)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (file_path, scheduled_for, title, description, enabled_platforms, platform_overrides),
+        )
+        vid = cur.lastrowid
     return vid
 
 
@@ -199,74 +269,115 @@ def add_many_to_queue(entries: Iterable[Dict[str, Any]]) -> List[int]:
     payload = list(entries)
     if not payload:
         return []
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.executemany(
-        """
-        INSERT INTO queue (file_path, scheduled_for, title, description, enabled_platforms, platform_overrides)
-        VALUES (:file_path, :scheduled_for, :title, :description, :enabled_platforms, :platform_overrides)
-        """,
-        payload,
-    )
-    conn.commit()
-    last_id = cur.lastrowid or 0
-    conn.close()
+    with _connection() as conn:
+        cur = conn.cursor()
+        cur.executemany(
+            """
+            INSERT INTO queue (file_path, scheduled_for, title, description, enabled_platforms, platform_overrides)
+            VALUES (:file_path, :scheduled_for, :title, :description, :enabled_platforms, :platform_overrides)
+            """,
+            payload,
+        )
+        last_id = cur.lastrowid or 0
     # Estimate ID range
     first_id = last_id - len(payload) + 1
     return list(range(first_id, last_id + 1))
 
 
 def get_queue(limit: int = 100) -> List[Dict[str, Any]]:
-    conn = get_conn()
-    rows = conn.execute(
-        """
-        SELECT * FROM queue
-        WHERE status != 'uploaded'
-        ORDER BY
-            CASE WHEN scheduled_for IS NULL THEN 1 ELSE 0 END,
-            scheduled_for ASC,
-            id ASC
-        LIMIT ?
-        """,
-        (limit,),
-    ).fetchall()
-    conn.close()
+    with _connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT * FROM queue
+            WHERE status != 'uploaded'
+            ORDER BY
+                CASE WHEN scheduled_for IS NULL THEN 1 ELSE 0 END,
+                scheduled_for ASC,
+                id ASC
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
     return [dict(row) for row in rows]
 
 
+def get_pending_queue(limit: int = 100) -> List[Dict[str, Any]]:
+    """
+    Return pending/retry rows in queue order, filtered in SQL.
+    """
+    with _connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT * FROM queue
+            WHERE status IN ('pending', 'retry')
+            ORDER BY
+                CASE WHEN scheduled_for IS NULL THEN 1 ELSE 0 END,
+                scheduled_for ASC,
+                id ASC
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def get_queue_status_counts() -> Dict[str, int]:
+    """
+    Return {status: count} for all queue rows, aggregated in SQL.
+    """
+    with _connection() as conn:
+        rows = conn.execute(
+            "SELECT status, COUNT(*) AS cnt FROM queue GROUP BY status"
+        ).fetchall()
+    return {row["status"]: row["cnt"] for row in rows}
+
+
+def get_next_scheduled_item() -> Optional[Dict[str, Any]]:
+    """
+    Return the earliest scheduled pending/retry row, or None.
+    """
+    with _connection() as conn:
+        row = conn.execute(
+            """
+            SELECT * FROM queue
+            WHERE status IN ('pending', 'retry')
+            AND scheduled_for IS NOT NULL
+            ORDER BY scheduled_for ASC, id ASC
+            LIMIT 1
+            """
+        ).fetchone()
+    return dict(row) if row else None
+
+
 def get_due_queue(now_iso: str) -> List[Dict[str, Any]]:
-    conn = get_conn()
-    # Prioritize items that are pending/retry and whose schedule time has passed
-    rows = conn.execute(
-        """
-        SELECT * FROM queue
-        WHERE status IN ('pending', 'retry')
-        AND (scheduled_for IS NULL OR scheduled_for <= ?)
-        ORDER BY
-            CASE WHEN scheduled_for IS NULL THEN 1 ELSE 0 END,
-            scheduled_for ASC,
-            id ASC
-        """,
-        (now_iso,),
-    ).fetchall()
-    conn.close()
+    with _connection() as conn:
+        # Prioritize items that are pending/retry and whose schedule time has passed
+        rows = conn.execute(
+            """
+            SELECT * FROM queue
+            WHERE status IN ('pending', 'retry')
+            AND (scheduled_for IS NULL OR scheduled_for <= ?)
+            ORDER BY
+                CASE WHEN scheduled_for IS NULL THEN 1 ELSE 0 END,
+                scheduled_for ASC,
+                id ASC
+            """,
+            (now_iso,),
+        ).fetchall()
     return [dict(row) for row in rows]
 
 
 def get_queue_item(queue_id: int) -> Optional[Dict[str, Any]]:
-    conn = get_conn()
-    row = conn.execute("SELECT * FROM queue WHERE id = ?", (queue_id,)).fetchone()
-    conn.close()
+    with _connection() as conn:
+        row = conn.execute("SELECT * FROM queue WHERE id = ?", (queue_id,)).fetchone()
     return dict(row) if row else None
 
 
 def increment_attempts(queue_id: int) -> None:
-    conn = get_conn()
-    conn.execute(
-        "UPDATE queue SET attempts = attempts + 1 WHERE id = ?", (queue_id,)
-    )
-    conn.commit()
-    conn.close()
+    with _connection() as conn:
+        conn.execute(
+            "UPDATE queue SET attempts = attempts + 1 WHERE id = ?", (queue_id,)
+        )
 
 
 def update_queue_status(
@@ -275,39 +386,45 @@ def update_queue_status(
     last_error: Optional[str] = None,
     platform_logs: Optional[Dict[str, Any]] = None,
 ) -> None:
-    conn = get_conn()
-    conn.execute(
-        """
-        UPDATE queue
-        SET status = ?, last_error = ?, platform_logs = ?
-        WHERE id = ?
-        """,
-        (
-            status,
-            last_error,
-            json.dumps(platform_logs or {}),
-            queue_id,
-        ),
-    )
-    conn.commit()
-    conn.close()
+    with _connection() as conn:
+        conn.execute(
+            """
+            UPDATE queue
+            SET status = ?, last_error = ?, platform_logs = ?
+            WHERE id = ?
+            """,
+            (
+                status,
+                last_error,
+                json.dumps(platform_logs or {}),
+                queue_id,
+            ),
+        )
+
+
+def reset_processing_to_pending() -> int:
+    """
+    Move every 'processing' row back to 'pending' in one statement, keeping its logs.
+    Returns the number of rows reset.
+    """
+    with _connection() as conn:
+        cur = conn.execute(
+            "UPDATE queue SET status = 'pending', last_error = NULL WHERE status = 'processing'"
+        )
+    return cur.rowcount
 
 
 def reschedule_queue_item(queue_id: int, scheduled_for: Optional[str]) -> None:
-    conn = get_conn()
-    conn.execute(
-        "UPDATE queue SET scheduled_for = ? WHERE id = ?",
-        (scheduled_for, queue_id),
-    )
-    conn.commit()
-    conn.close()
+    with _connection() as conn:
+        conn.execute(
+            "UPDATE queue SET scheduled_for = ? WHERE id = ?",
+            (scheduled_for, queue_id),
+        )
 
 
 def delete_from_queue(queue_id: int) -> None:
-    conn = get_conn()
-    conn.execute("DELETE FROM queue WHERE id = ?", (queue_id,))
-    conn.commit()
-    conn.close()
+    with _connection() as conn:
+        conn.execute("DELETE FROM queue WHERE id = ?", (queue_id,))
 
 
 def cleanup_uploaded(count: int) -> Tuple[int, int]:
@@ -334,37 +451,33 @@ def cleanup_uploaded(count: int) -> Tuple[int, int]:
 
 
 def set_account_state(platform: str, connected: bool, last_error: Optional[str]) -> None:
-    conn = get_conn()
-    conn.execute(
-        """
-        INSERT INTO account_state (platform, connected, last_error, updated_at)
-        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-        ON CONFLICT(platform) DO UPDATE SET
-            connected = excluded.connected,
-            last_error = excluded.last_error,
-            updated_at = CURRENT_TIMESTAMP
-        """,
-        (platform, int(bool(connected)), last_error),
-    )
-    conn.commit()
-    conn.close()
+    with _connection() as conn:
+        conn.execute(
+            """
+            INSERT INTO account_state (platform, connected, last_error, updated_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(platform) DO UPDATE SET
+                connected = excluded.connected,
+                last_error = excluded.last_error,
+                updated_at = CURRENT_TIMESTAMP
+            """,
+            (platform, int(bool(connected)), last_error),
+        )
 
 
 def get_account_state(platform: str) -> Dict[str, Any]:
-    conn = get_conn()
-    row = conn.execute(
-        "SELECT * FROM account_state WHERE platform = ?", (platform,)
-    ).fetchone()
-    conn.close()
+    with _connection() as conn:
+        row = conn.execute(
+            "SELECT * FROM account_state WHERE platform = ?", (platform,)
+        ).fetchone()
     if not row:
         return {"platform": platform, "connected": 0, "last_error": None, "updated_at": None}
     return dict(row)
 
 
 def get_all_account_states() -> Dict[str, Dict[str, Any]]:
-    conn = get_conn()
-    rows = conn.execute("SELECT * FROM account_state").fetchall()
-    conn.close()
+    with _connection() as conn:
+        rows = conn.execute("SELECT * FROM account_state").fetchall()
     return {row["platform"]: dict(row) for row in rows}
 
 
@@ -374,10 +487,9 @@ def archive_uploaded_item(queue_row: Dict[str, Any], platform_logs: Optional[Dic
     """
     Persist completed uploads to the uploads table and remove from the active queue.
     """
-    conn = get_conn()
     logs_json = json.dumps(platform_logs or {})
     uploaded_at = datetime.utcnow().isoformat()
-    try:
+    with _connection() as conn:
         conn.execute(
             """
             INSERT INTO uploads (queue_id, file_path, uploaded_at, title, description, platform_logs)
@@ -393,51 +505,42 @@ def archive_uploaded_item(queue_row: Dict[str, Any], platform_logs: Optional[Dic
             ),
         )
         conn.execute("DELETE FROM queue WHERE id = ?", (queue_row.get("id"),))
-        conn.commit()
-    finally:
-        conn.close()
 
 
 def delete_uploaded_item(upload_id: int) -> None:
-    conn = get_conn()
-    conn.execute("DELETE FROM uploads WHERE id = ?", (upload_id,))
-    conn.commit()
-    conn.close()
+    with _connection() as conn:
+        conn.execute("DELETE FROM uploads WHERE id = ?", (upload_id,))
 
 
 def get_uploaded_items(limit: int = 100) -> List[Dict[str, Any]]:
     """
     Return the oldest uploaded items first so cleanup can prune them.
     """
-    conn = get_conn()
-    rows = conn.execute(
-        """
-        SELECT * FROM uploads
-        ORDER BY uploaded_at DESC, id DESC
-        LIMIT ?
-        """,
-        (limit,),
-    ).fetchall()
-    conn.close()
+    with _connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT * FROM uploads
+            ORDER BY uploaded_at DESC, id DESC
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
     return [dict(row) for row in rows]
 
 
 def get_uploaded_count() -> int:
-    conn = get_conn()
-    row = conn.execute("SELECT COUNT(*) AS cnt FROM uploads").fetchone()
-    conn.close()
+    with _connection() as conn:
+        row = conn.execute("SELECT COUNT(*) AS cnt FROM uploads").fetchone()
     return row["cnt"] if row else 0
 
 
 # --- Backup & Restore ---
 
 def get_all_settings() -> Dict[str, Any]:
-    conn = get_conn()
-    rows = conn.execute("SELECT key, value FROM settings").fetchall()
-    conn.close()
+    with _connection() as conn:
+        rows = conn.execute("SELECT key, value FROM settings").fetchall()
     return {row["key"]: row["value"] for row in rows}
 
-
 def export_config() -> Dict[str, Any]:
     """
     Export settings and account_state for backup/migration.
@@ -456,8 +559,7 @@ def import_config(payload: Dict[str, Any]) -> Tuple[int, int]:
     settings = payload.get("settings") or {}
     accounts = payload.get("account_state") or {}
 
-    for key, value in settings.items():
-        set_config(key, value)
+    set_configs(settings)
 
     for platform, state in accounts.items():
         set_account_state(platform, bool(state.get("connected")), state.get("last_error"))
@@ -470,12 +572,11 @@ def clear_platform_status(queue_id: int, platform_key: str) -> bool:
     Clear a specific platform's status from platform_logs to allow retry.
     Returns True if successful, False otherwise.
     """
-    conn = get_conn()
-    try:
+    with _connection() as conn:
         row = conn.execute("SELECT platform_logs FROM queue WHERE id = ?", (queue_id,)).fetchone()
         if not row:
             return False
-        
+
         logs = {}
         raw_logs = row["platform_logs"]
         if raw_logs:
@@ -483,17 +584,14 @@ def clear_platform_status(queue_id: int, platform_key: str) -> bool:
                 logs = json.loads(raw_logs) if isinstance(raw_logs, str) else raw_logs
             except (json.JSONDecodeError, TypeError):
                 logs = {}
-        
+
         # Clear the specific platform status
         if platform_key in logs:
             del logs[platform_key]
-            
+
             conn.execute(
                 "UPDATE queue SET platform_logs = ? WHERE id = ?",
                 (json.dumps(logs), queue_id)
             )
-            conn.commit()
             return True
         return False
-    finally:
-        conn.close()
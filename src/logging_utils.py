@@ -1,10 +1,12 @@
 import logging
+import os
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
 LOG_DIR = Path("data/logs")
 LOG_FILE = LOG_DIR / "scheduler.log"
 BASE_LOGGER_NAME = "scheduler"
+TAIL_CHUNK_SIZE = 8192
 _LOG_ONCE_KEYS = set()
 
 
@@ -63,12 +65,31 @@ def get_log_file_path() -> Path:
     return LOG_FILE
 
 
+def _read_tail_lines(path: Path, lines: int) -> list:
+    """
+    Read the last `lines` lines by seeking backwards from EOF in fixed-size chunks,
+    so the cost is bounded by the tail size rather than the whole file.
+    """
+    chunks = []
+    newlines = 0
+    with path.open("rb") as fh:
+        pos = fh.seek(0, os.SEEK_END)
+        while pos > 0 and newlines <= lines:
+            step = min(TAIL_CHUNK_SIZE, pos)
+            pos -= step
+            fh.seek(pos)
+            chunk = fh.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    data = b"".join(reversed(chunks))
+    return [line.decode("utf-8", errors="ignore") for line in data.splitlines(keepends=True)[-lines:]]
+
+
 def tail_log(lines: int = 200) -> str:
     path = get_log_file_path()
     if not path.exists():
         return "Log file not created yet."
-    with path.open("r", encoding="utf-8", errors="ignore") as fh:
-        data = fh.readlines()[-lines:]
+    data = _read_tail_lines(path, lines)
     return "".join(data) if data else "Log file is empty."
 
 
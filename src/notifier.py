@@ -1,13 +1,14 @@
 from typing import Optional
 import requests
-from src.database import get_config
+from src.database import get_configs
 from src.logging_utils import init_logging
 
 logger = init_logging("notifier")
 
 def _telegram_endpoint() -> Optional[str]:
-    token = get_config("telegram_bot_token")
-    chat_id = get_config("telegram_chat_id")
+    cfg = get_configs({"telegram_bot_token": None, "telegram_chat_id": None})
+    token = cfg["telegram_bot_token"]
+    chat_id = cfg["telegram_chat_id"]
     if not token or not chat_id:
         return None
     return f"https://api.telegram.org/bot{token}/sendMessage", chat_id
@@ -10,14 +10,15 @@ from instagrapi.exceptions import (
 from pydantic import ValidationError
 
 from src.logging_utils import init_logging
-from src.database import get_config, set_account_state, set_config
+from src.database import get_config, get_configs, set_account_state, set_config
 
 SESSION_KEY = "insta_session"
 SESSION_ID_KEY = "insta_sessionid"
 logger = init_logging("instagram")
 
 def _credentials() -> Tuple[str, str]:
-    return get_config("insta_user"), get_config("insta_pass")
+    cfg = get_configs({"insta_user": None, "insta_pass": None})
+    return cfg["insta_user"], cfg["insta_pass"]
 
 def _format_error(exc: Exception) -> str:
     try:
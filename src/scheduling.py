@@ -1,5 +1,6 @@
 import math
 from datetime import datetime, timedelta, time
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 import pytz
@@ -12,6 +13,14 @@ DEFAULT_SCHEDULE = {
     "timezone": "UTC",
 }
 
+DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")  # index = weekday, 0=Mon
+
+
+@lru_cache(maxsize=8)
+def get_timezone(name: str):
+    """Memoized pytz.timezone(); raises UnknownTimeZoneError like the original."""
+    return pytz.timezone(name)
+
 
 def _normalize_schedule(config: Optional[Dict]) -> Dict[str, List]:
     if not config:
@@ -33,7 +42,7 @@ def _normalize_schedule(config: Optional[Dict]) -> Dict[str, List]:
     if not valid_days:
         valid_days = DEFAULT_SCHEDULE["days"]
     try:
-        pytz.timezone(tz_name)
+        get_timezone(tz_name)
     except Exception:
         tz_name = DEFAULT_SCHEDULE["timezone"]
     return {"days": valid_days, "times": sorted(valid_times), "timezone": tz_name}
@@ -62,7 +71,7 @@ def _parse_time(value: str) -> time:
 
 def next_slots(count: int, start: Optional[datetime] = None) -> List[datetime]:
     cfg = get_schedule()
-    tz = pytz.timezone(cfg["timezone"])
+    tz = get_timezone(cfg["timezone"])
     if start:
         now = start if start.tzinfo else tz.localize(start)
         now = now.astimezone(tz)
@@ -98,7 +107,7 @@ def next_daily_slots(
     """
     occupied_dates = occupied_dates or set()
     cfg = get_schedule()
-    tz = pytz.timezone(cfg["timezone"])
+    tz = get_timezone(cfg["timezone"])
     now = datetime.now(tz) if start is None else (start if start.tzinfo else tz.localize(start)).astimezone(tz)
 
     slots: List[datetime] = []
@@ -120,7 +129,6 @@ def next_daily_slots(
 
 def human_readable_schedule() -> str:
     cfg = get_schedule()
-    days_map = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    days = ", ".join(days_map[d] for d in cfg["days"])
+    days = ", ".join(DAY_NAMES[d] for d in cfg["days"])
     times = ", ".join(cfg["times"])
     return f"{days} @ {times} ({cfg['timezone']})"
@@ -0,0 +1,137 @@
+import json
+from pathlib import Path
+
+import streamlit as st
+
+from src.database import (
+    export_config,
+    get_all_settings,
+    get_next_scheduled_item,
+    get_queue,
+    get_queue_status_counts,
+    get_uploaded_count,
+)
+from src.platform_registry import all_platform_statuses, get_platforms
+from src.scheduling import get_schedule, human_readable_schedule, next_slots
+from src import ui_logic
+
+DATA_DIR = Path("data")
+
+# Short-lived caches for the reads every rerun performs. Mutation sites clear the
+# matching cache before st.rerun() so the UI never shows stale data after an action.
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def cached_queue(limit: int = 100):
+    """Active queue rows, cached across back-to-back reruns."""
+    return get_queue(limit)
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def cached_status_counts():
+    """{status: count} for the dashboard metrics."""
+    return get_queue_status_counts()
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def cached_uploaded_count():
+    """Number of archived uploads for the Done metric."""
+    return get_uploaded_count()
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def cached_next_scheduled():
+    """Earliest scheduled pending/retry row, or None."""
+    return get_next_scheduled_item()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_schedule():
+    """Normalized publish schedule."""
+    return get_schedule()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_schedule_text():
+    """Human-readable schedule summary for the dashboard."""
+    return human_readable_schedule()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_next_slot():
+    """Next free publish slot from the schedule, or None."""
+    upcoming = next_slots(1)
+    return upcoming[0] if upcoming else None
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def cached_settings():
+    """Whole settings table in one SELECT, shared by every tab."""
+    return get_all_settings()
+
+
+def cached_config(key: str, default=None):
+    """Drop-in for get_config() backed by the cached settings dict."""
+    return cached_settings().get(key, default)
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def cached_backup_blob() -> bytes:
+    """Encoded export_config() for the Settings backup download."""
+    return json.dumps(export_config(), indent=2).encode("utf-8")
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_storage_summary():
+    """(used_gb, free_gb, total_gb, percent) for the data volume."""
+    return ui_logic.get_storage_summary(DATA_DIR)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_platform_snapshot():
+    """[(key, label, connected)] for the status badges; one live check per platform."""
+    statuses = all_platform_statuses()  # syncs account_state with the live check
+    return [
+        (key, cfg["label"], bool(statuses.get(key, {}).get("connected")))
+        for key, cfg in get_platforms().items()
+    ]
+
+
+@st.cache_data(ttl=30, max_entries=4, show_spinner=False)
+def cached_queue_dataframe(fingerprint, _queue_rows):
+    """Overview DataFrame for the queue, rebuilt only when the fingerprint changes."""
+    return ui_logic.format_queue_dataframe(_queue_rows)
+
+
+def queue_fingerprint(queue_rows, tz_name: str):
+    """Cheap cache key covering every field the overview table shows."""
+    return tz_name, tuple(
+        (row["id"], row["file_path"], row.get("scheduled_for"), row.get("status"), row.get("attempts"), row.get("last_error"))
+        for row in queue_rows
+    )
+
+
+def clear_queue_cache() -> None:
+    cached_queue.clear()
+    cached_status_counts.clear()
+    cached_next_scheduled.clear()
+    cached_uploaded_count.clear()
+
+
+def clear_config_cache() -> None:
+    cached_settings.clear()
+    cached_backup_blob.clear()
+
+
+def clear_schedule_cache() -> None:
+    cached_schedule.clear()
+    cached_schedule_text.clear()
+    cached_next_slot.clear()
+
+
+def clear_storage_cache() -> None:
+    cached_storage_summary.clear()
+
+
+def clear_platform_cache() -> None:
+    cached_platform_snapshot.clear()
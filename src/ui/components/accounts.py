@@ -11,9 +11,10 @@ from src.auth_utils import (
     set_config as auth_set_config,
     set_account_state,
 )
-from src.database import get_config, set_config
+from src.database import set_configs
 from src.platforms import instagram as instagram_platform
 from src.platforms import tiktok as tiktok_platform
+from src.ui.cache import cached_config, clear_config_cache, clear_platform_cache
 from src import ui_logic
 
 
@@ -29,24 +30,26 @@ def render_accounts_tab(logger):
             "1. Google Cloud Console -> Create OAuth Client ID (Desktop app).\n"
             "2. Download JSON and paste below."
         )
-        google_json = st.text_area(
-            "Google client JSON",
-            value=get_google_client_config(pretty=True) or "",
-            height=200,
-            key="google_json_input",
-        )
-        if st.button("Save Google OAuth JSON"):
-            if not google_json.strip():
-                st.warning("Paste the JSON first.")
-            else:
-                ok, msg = save_google_client_config(google_json.strip())
-                if ok:
-                    logger.info("Google OAuth JSON saved (%s bytes).", len(google_json.strip()))
-                    st.success(msg)
-                    st.rerun()
+        with st.form("google_json_form", border=False):
+            google_json = st.text_area(
+                "Google client JSON",
+                value=get_google_client_config(pretty=True) or "",
+                height=200,
+                key="google_json_input",
+            )
+            if st.form_submit_button("Save Google OAuth JSON"):
+                if not google_json.strip():
+                    st.warning("Paste the JSON first.")
                 else:
-                    logger.warning("Failed to save Google OAuth JSON: %s", msg)
-                    st.error(msg)
+                    ok, msg = save_google_client_config(google_json.strip())
+                    if ok:
+                        logger.info("Google OAuth JSON saved (%s bytes).", len(google_json.strip()))
+                        st.success(msg)
+                        clear_platform_cache()
+                        st.rerun()
+                    else:
+                        logger.warning("Failed to save Google OAuth JSON: %s", msg)
+                        st.error(msg)
         
         yt_connected = youtube_connected()
         if google_config_present:
@@ -60,6 +63,7 @@ def render_accounts_tab(logger):
                         if ok:
                             logger.info("YouTube authentication successful")
                             st.success("Connected!")
+                            clear_platform_cache()
                             st.rerun()
                         else:
                             logger.warning("YouTube authentication failed: %s", message)
@@ -75,45 +79,50 @@ def render_accounts_tab(logger):
                     logger.info("YouTube disconnected by user")
                     auth_set_config("youtube_credentials", "")
                     set_account_state("youtube", False, "")
+                    clear_platform_cache()
                     st.rerun()
     
     # Instagram
     st.markdown("### **Instagram**")
     
     with st.expander("Instagram"):
-        # Session ID input
-        st.caption("Session ID (from browser cookies)")
-        ig_session = st.text_area("Session ID", value=get_config("insta_sessionid", ""), height=60, key="ig_session")
-        
-        # Username/Password input
-        st.markdown("---")
-        st.caption("Or login with username/password")
-        ig_user = st.text_input("Username", value=get_config("insta_user", ""), key="ig_user")
-        ig_pass = st.text_input("Password", type="password", key="ig_pass")
-        
-        c1, c2, c3 = st.columns(3)
-        with c1:
-            if st.button("Save Session", key="ig_save_btn"):
+        with st.form("instagram_form", border=False):
+            # Session ID input
+            st.caption("Session ID (from browser cookies)")
+            ig_session = st.text_area("Session ID", value=cached_config("insta_sessionid", ""), height=60, key="ig_session")
+            
+            # Username/Password input
+            st.markdown("---")
+            st.caption("Or login with username/password")
+            ig_user = st.text_input("Username", value=cached_config("insta_user", ""), key="ig_user")
+            ig_pass = st.text_input("Password", type="password", key="ig_pass")
+            
+            c1, c2 = st.columns(2)
+            save_session = c1.form_submit_button("Save Session", key="ig_save_btn")
+            save_creds = c2.form_submit_button("Save Credentials", key="ig_creds_btn")
+            if save_session:
                 ok, msg = instagram_platform.save_sessionid(ig_session)
                 logger.info("Instagram session save: %s - %s", ok, msg)
                 st.success(msg) if ok else st.error(msg)
+                clear_config_cache()
+                clear_platform_cache()
                 st.rerun()
-        with c2:
-            if st.button("Save Credentials", key="ig_creds_btn"):
-                set_config("insta_user", ig_user)
-                set_config("insta_pass", ig_pass)
+            if save_creds:
+                set_configs({"insta_user": ig_user, "insta_pass": ig_pass})
                 if ig_user and ig_pass:
                     logger.info("Instagram credentials saved")
                     st.success("Credentials saved!")
                 else:
                     logger.info("Instagram credentials cleared")
                     st.info("Credentials cleared.")
+                clear_config_cache()
+                clear_platform_cache()
                 st.rerun()
-        with c3:
-            if st.button("Verify", key="ig_verify_btn"):
-                ok, msg = instagram_platform.verify_login()
-                logger.info("Instagram verification: %s - %s", ok, msg)
-                st.success(msg) if ok else st.error(msg)
+        
+        if st.button("Verify", key="ig_verify_btn"):
+            ok, msg = instagram_platform.verify_login()
+            logger.info("Instagram verification: %s - %s", ok, msg)
+            st.success(msg) if ok else st.error(msg)
     
     # TikTok
     st.markdown("### **TikTok**")
@@ -129,7 +138,7 @@ def render_accounts_tab(logger):
     
     with st.form("tiktok_form"):
         st.caption("Paste sessionid")
-        tt_input = st.text_area("Session", value=get_config("tiktok_sessionid", ""), height=60, key="tt_session")
+        tt_input = st.text_area("Session", value=cached_config("tiktok_sessionid", ""), height=60, key="tt_session")
         if st.form_submit_button("Save", key="tt_save_btn", type="primary"):
             raw_input = tt_input.strip()
             if "%" in raw_input:
@@ -143,6 +152,8 @@ def render_accounts_tab(logger):
                 tiktok_platform.verify_session(force=True)
                 logger.info("TikTok session saved")
                 st.success("Saved!")
+                clear_config_cache()
+                clear_platform_cache()
                 st.rerun()
             else:
                 logger.warning("No sessionid found in TikTok input")
@@ -153,8 +164,11 @@ def render_accounts_tab(logger):
         ok, msg = tiktok_platform.verify_session(force=True)
         logger.info("TikTok verification: %s - %s", ok, msg)
         st.success(msg) if ok else st.error(msg)
+        clear_platform_cache()
         st.rerun()
     if c2.button("Clear", key="tt_clear_btn"):
         logger.info("TikTok session cleared by user")
         tiktok_platform.save_session("")
+        clear_config_cache()
+        clear_platform_cache()
         st.rerun()
@@ -1,16 +1,28 @@
 import streamlit as st
-from pathlib import Path
-from src.database import get_config, set_config, cleanup_uploaded
-from src.scheduling import human_readable_schedule, next_slots
+from src.database import set_config, cleanup_uploaded
+from src.ui.cache import (
+    cached_config,
+    cached_next_scheduled,
+    cached_next_slot,
+    cached_queue,
+    cached_schedule,
+    cached_schedule_text,
+    cached_status_counts,
+    cached_storage_summary,
+    clear_config_cache,
+    clear_queue_cache,
+    clear_storage_cache,
+)
 from src import ui_logic
 
 
-def render_dashboard_tab(queue_rows, uploaded_count: int, logger):
+def render_dashboard_tab(uploaded_count: int, logger):
     """Render minimal dashboard."""
-    # Metrics - Simple row
-    pending = sum(1 for row in queue_rows if row["status"] in ("pending", "retry"))
-    processing = sum(1 for row in queue_rows if row["status"] == "processing")
-    paused = bool(int(get_config("queue_paused", 0) or 0))
+    # Metrics - aggregated in SQL, no full queue scan
+    counts = cached_status_counts()
+    pending = counts.get("pending", 0) + counts.get("retry", 0)
+    processing = counts.get("processing", 0)
+    paused = bool(int(cached_config("queue_paused", 0) or 0))
     
     # Simple metric row
     c1, c2, c3, c4 = st.columns(4)
@@ -34,34 +46,33 @@ def render_dashboard_tab(queue_rows, uploaded_count: int, logger):
         else:
             # Queue was unpaused - reschedule all pending items to next available slots
             logger.info("Queue unpaused by user - rescheduling pending items")
-            rescheduled_count, _ = ui_logic.reschedule_pending_items(queue_rows)
+            rescheduled_count, _ = ui_logic.reschedule_pending_items(cached_queue())
             logger.info("Rescheduled %d pending items after unpause", rescheduled_count)
+            clear_queue_cache()
         
+        clear_config_cache()
         st.rerun()
     
     # Schedule - Simple
     st.markdown("### **Schedule**")
-    st.info(human_readable_schedule())
+    st.info(cached_schedule_text())
     
     if paused:
         st.warning("Queue paused")
     else:
-        next_up = next(
-            (row for row in queue_rows if row.get("scheduled_for") and row["status"] in ("pending", "retry")),
-            None,
-        )
+        next_up = cached_next_scheduled()
         if next_up:
-            st.success(f"Next: #{next_up['id']} at {ui_logic.format_datetime_for_ui(next_up['scheduled_for'])}")
+            st.success(f"Next: #{next_up['id']} at {ui_logic.format_datetime_for_ui(next_up['scheduled_for'], ui_logic.resolve_timezone(cached_schedule()['timezone']))}")
         else:
-            upcoming = next_slots(1)
+            upcoming = cached_next_slot()
             if upcoming:
-                st.info(f"Next slot: {upcoming[0].strftime('%b %d %H:%M')}")
+                st.info(f"Next slot: {upcoming.strftime('%b %d %H:%M')}")
             else:
                 st.error("No schedule slots!")
     
     # Storage - Simple bar
     st.markdown("### **Storage**")
-    used_gb, free_gb, total_gb, percent = ui_logic.get_storage_summary(Path("data"))
+    used_gb, free_gb, total_gb, percent = cached_storage_summary()
     if total_gb is not None:
         st.progress(percent / 100.0)
         st.caption(f"Used {used_gb:.1f}GB / {total_gb:.1f}GB")
@@ -69,4 +80,6 @@ def render_dashboard_tab(queue_rows, uploaded_count: int, logger):
             deleted, freed = cleanup_uploaded(20)
             if deleted:
                 st.success(f"Deleted {deleted}, freed {freed/ (1024**2):.1f} MB")
+                clear_storage_cache()
+                clear_queue_cache()
                 st.rerun()
@@ -1,8 +1,34 @@
+import re
 import streamlit as st
+from pathlib import Path
 from src.logging_utils import get_log_file_path, tail_log
 from src.log_display import parse_log_data
 
 
+# Static log viewer chrome; only the line count and the rendered rows vary
+_VIEWER_HEAD = (
+    '<div style="background:var(--bg-input);border:1px solid var(--border);border-radius:var(--radius-sm);margin-bottom:1rem;overflow:hidden;">'
+    '<div style="background:var(--bg-card);padding:0.6rem 0.75rem;border-bottom:1px solid var(--border);display:flex;justify-content:space-between;align-items:center;font-size:0.75rem;font-weight:600;color:var(--text-secondary);text-transform:uppercase;letter-spacing:0.5px;">'
+    '<span>Log Viewer</span>'
+    '<span style="font-size:0.75rem;color:var(--text-secondary);">{count} lines</span>'
+    '</div>'
+    '<div style="max-height:400px;overflow-y:auto;">'
+)
+_VIEWER_TAIL = '</div></div>'
+
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _log_download_bytes(path: str, mtime_ns: int, size: int) -> bytes:
+    """Full log payload for the download button, re-read only when the file changes."""
+    return Path(path).read_bytes()
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _log_tail(path: str, mtime_ns: int, size: int, lines: int) -> str:
+    """Last `lines` lines of the log; keyed on the file stat so an unchanged log is not re-read."""
+    return tail_log(lines)
+
+
 def render_logs_tab():
     """Render logs with professional display."""
     st.markdown("### **Logs**")
@@ -17,55 +43,46 @@ def render_logs_tab():
         key="log_lines_select"
     )
     
-    # Filter input on separate row
-    filter_text = st.text_input("Filter", key="log_filter", placeholder="Search...")
+    # Filter only applies on submit, not on every edit of the input
+    with st.form("log_filter_form", clear_on_submit=False, border=False):
+        filter_text = st.text_input("Filter", key="log_filter", placeholder="Search...")
+        st.form_submit_button("Apply", key="log_filter_apply_btn")
     
     # Action buttons on separate row
     c_refresh, c_clear = st.columns(2)
     with c_refresh:
-        if st.button("⟳ Refresh", key="logs_refresh_btn"):
-            st.rerun()
+        # The click itself reruns the fragment, which re-reads the log below.
+        st.button("⟳ Refresh", key="logs_refresh_btn")
     with c_clear:
         if st.button("✕ Clear", key="logs_clear_btn"):
             if log_path.exists():
                 log_path.write_text("")
                 st.success("Cleared!")
-                st.rerun()
+                st.rerun(scope="fragment")
     
-    # Load logs
-    raw_log = tail_log(line_count) if line_count else (log_path.read_text(encoding="utf-8", errors="ignore") if log_path.exists() else "")
+    # Load logs - bounded seek-from-EOF read, skipped entirely while the file is unchanged
+    log_stat = log_path.stat() if log_path.exists() else None
+    raw_log = _log_tail(str(log_path), log_stat.st_mtime_ns, log_stat.st_size, line_count) if log_stat else ""
     
-    # Apply filter
+    # Apply filter - one compiled case-insensitive pattern instead of lowercasing every line
     if filter_text.strip():
-        lines = [l for l in raw_log.splitlines() if filter_text.lower() in l.lower()]
-        display_lines = lines
+        pattern = re.compile(re.escape(filter_text), re.IGNORECASE)
+        display_lines = [l for l in raw_log.splitlines() if pattern.search(l)]
     else:
         display_lines = raw_log.splitlines()
     
-    # Parse log lines for display
-    log_data = parse_log_data(display_lines)
-    
-    # Professional log container
-    status_class = 'live' if log_path.exists() and log_path.stat().st_size > 0 else 'empty'
-    
-    st.markdown(f"""
-    <div style="background:var(--bg-input);border:1px solid var(--border);border-radius:var(--radius-sm);margin-bottom:1rem;overflow:hidden;">
-        <div style="background:var(--bg-card);padding:0.6rem 0.75rem;border-bottom:1px solid var(--border);display:flex;justify-content:space-between;align-items:center;font-size:0.75rem;font-weight:600;color:var(--text-secondary);text-transform:uppercase;letter-spacing:0.5px;">
-            <span>Log Viewer</span>
-            <span style="font-size:0.75rem;color:var(--text-secondary);">{len(display_lines)} lines</span>
-        </div>
-        <div style="max-height:400px;overflow-y:auto;">
-            {''.join(log_data)}
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    # Professional log container; rows are rendered straight into the join
+    st.markdown(
+        _VIEWER_HEAD.format(count=len(display_lines)) + ''.join(parse_log_data(display_lines)) + _VIEWER_TAIL,
+        unsafe_allow_html=True,
+    )
     
     # Download button
-    if log_path.exists():
+    if log_stat:
         st.download_button(
             "Download Logs", 
             key="logs_download_btn", 
-            data=log_path.read_text(), 
+            data=_log_download_bytes(str(log_path), log_stat.st_mtime_ns, log_stat.st_size), 
             file_name="logs.txt", 
             mime="text/plain"
         )
@@ -1,78 +1,126 @@
 import streamlit as st
-from src.platform_registry import all_platform_statuses, get_platforms
+from concurrent.futures import ThreadPoolExecutor
 from src.platforms import tiktok as tiktok_platform
 from src.platforms import instagram as instagram_platform
 from src.auth_utils import verify_youtube_credentials
+from src.ui.cache import cached_platform_snapshot, clear_platform_cache
 
 
-def refresh_platform_statuses(logger):
-    """Check platform connectivity."""
-    try:
-        verify_youtube_credentials(probe_api=True)
-        logger.debug("YouTube credentials verified during refresh")
-    except Exception as e:
-        logger.warning("YouTube credentials verification failed during refresh: %s", e)
-    try:
-        instagram_platform.verify_login()
-        logger.debug("Instagram login verified during refresh")
-    except Exception as e:
-        logger.warning("Instagram login verification failed during refresh: %s", e)
+PROBE_TTL_SECONDS = 30
+REFRESH_POLL_SECONDS = 1
+_REFRESH_STATE_KEY = "platform_refresh"
+
+# Refreshes run off the script thread; one at a time is plenty
+_REFRESH_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="platform-refresh")
+
+# Uniform badge markup; only the label varies per render
+_BADGE_TPL = (
+    '<div class="platform-status {cls}">'
+    '<div class="platform-name">{label}</div>'
+    '<div class="platform-state">{state}</div>'
+    '</div>'
+)
+_CONNECTED_TPL = _BADGE_TPL.format(cls="connected", label="{}", state="Connected")
+_DISCONNECTED_TPL = _BADGE_TPL.format(cls="disconnected", label="{}", state="Not Connected")
+
+
+# Each probe is a network round-trip; memoize results briefly so repeated
+# refresh clicks inside the window do not hit the APIs again.
+@st.cache_data(ttl=PROBE_TTL_SECONDS, show_spinner=False)
+def _probe_youtube():
+    return verify_youtube_credentials(probe_api=True)
+
+
+@st.cache_data(ttl=PROBE_TTL_SECONDS, show_spinner=False)
+def _probe_instagram():
+    return instagram_platform.verify_login()
+
+
+@st.cache_data(ttl=PROBE_TTL_SECONDS, show_spinner=False)
+def _probe_tiktok():
+    return tiktok_platform.verify_session(force=True)
+
+
+def clear_probe_cache() -> None:
+    _probe_youtube.clear()
+    _probe_instagram.clear()
+    _probe_tiktok.clear()
+
+
+_PROBES = (
+    ("YouTube", _probe_youtube),
+    ("Instagram", _probe_instagram),
+    ("TikTok", _probe_tiktok),
+)
+
+
+def _run_probe(probe):
+    """Run one probe, returning (ok, error) instead of raising."""
     try:
-        tiktok_platform.verify_session(force=True)
-        logger.debug("TikTok session verified during refresh")
+        probe()
+        return True, None
     except Exception as e:
-        logger.warning("TikTok session verification failed during refresh: %s", e)
+        return False, e
+
 
+def refresh_platform_statuses(logger):
+    """Check platform connectivity. The probes are independent, so run them concurrently."""
+    with ThreadPoolExecutor(max_workers=len(_PROBES)) as pool:
+        results = list(pool.map(_run_probe, [probe for _, probe in _PROBES]))
 
+    # Log in a fixed order regardless of which probe finished first
+    for (name, _), (ok, err) in zip(_PROBES, results):
+        if ok:
+            logger.debug("%s verified during refresh", name)
+        else:
+            logger.warning("%s verification failed during refresh: %s", name, err)
+
+
+@st.fragment(run_every=REFRESH_POLL_SECONDS)
+def _poll_refresh(logger):
+    """Wait for a background refresh; rerun the app once it finishes so the badges redraw."""
+    pending = st.session_state.get(_REFRESH_STATE_KEY)
+    if pending is None:
+        return
+    future, forced = pending
+    if not future.done():
+        st.caption("Checking...")
+        return
+    st.session_state.pop(_REFRESH_STATE_KEY, None)
+    logger.info("Platform statuses refreshed by user%s", " (forced)" if forced else "")
+    clear_platform_cache()
+    st.rerun()
+
+
+@st.fragment
 def render_platform_status(logger):
-    """Render platform connections - minimal row."""
+    """Render platform connections - minimal row. Runs as a fragment so Refresh only redraws this row."""
     st.markdown("### **Platforms**")
     
-    statuses = all_platform_statuses()
-    registry = get_platforms()
-    
-    # Log overall platform statuses
-    connected_count = 0
-    for key, cfg in registry.items():
-        state = statuses.get(key, {})
-        live_connected = cfg["connected"]()
-        state_connected = bool(state.get("connected"))
-        connected = live_connected and state_connected
-        if connected:
-            connected_count += 1
-    logger.debug("Platform statuses: %d/%d connected", connected_count, len(registry))
+    snapshot = cached_platform_snapshot()
+    connected_count = sum(1 for _, _, connected in snapshot if connected)
+    logger.debug("Platform statuses: %d/%d connected", connected_count, len(snapshot))
     
     # Simple row of badges - uniform styled containers
     cols = st.columns(3)
     
-    for idx, (key, cfg) in enumerate(registry.items()):
-        with cols[idx]:
-            state = statuses.get(key, {})
-            live_connected = cfg["connected"]()
-            state_connected = bool(state.get("connected"))
-            connected = live_connected and state_connected
-            
-            # Use uniform HTML containers
-            if connected:
-                st.markdown(f'''
-                <div class="platform-status connected">
-                    <div class="platform-name">{cfg['label']}</div>
-                    <div class="platform-state">Connected</div>
-                </div>
-                ''', unsafe_allow_html=True)
-            else:
-                st.markdown(f'''
-                <div class="platform-status disconnected">
-                    <div class="platform-name">{cfg['label']}</div>
-                    <div class="platform-state">Not Connected</div>
-                </div>
-                ''', unsafe_allow_html=True)
+    for idx, (key, label, connected) in enumerate(snapshot):
+        tpl = _CONNECTED_TPL if connected else _DISCONNECTED_TPL
+        cols[idx].markdown(tpl.format(label), unsafe_allow_html=True)
     
-    # Refresh below
+    # Refresh below - probes run in the background so the page stays usable
+    refreshing = _REFRESH_STATE_KEY in st.session_state
     st.markdown('<div class="refresh-btn">', unsafe_allow_html=True)
-    if st.button("Refresh Status", key="refresh_status", type="secondary"):
-        with st.spinner("Checking..."):
-            refresh_platform_statuses(logger)
-        logger.info("Platform statuses refreshed by user")
-        st.rerun()
+    rc1, rc2 = st.columns(2)
+    refresh = rc1.button("Refresh Status", key="refresh_status", type="secondary", disabled=refreshing)
+    force = rc2.button("Force Refresh", key="force_refresh_status", type="secondary", disabled=refreshing)
+    if (refresh or force) and not refreshing:
+        if force:
+            clear_probe_cache()
+        future = _REFRESH_POOL.submit(refresh_platform_statuses, logger)
+        st.session_state[_REFRESH_STATE_KEY] = (future, force)
+        st.rerun(scope="fragment")
     st.markdown('</div>', unsafe_allow_html=True)
+    
+    if refreshing:
+        _poll_refresh(logger)
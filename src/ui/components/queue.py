@@ -1,20 +1,28 @@
+import hashlib
 import json
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timedelta
-from src.database import clear_platform_status, delete_from_queue, reschedule_queue_item, update_queue_status, get_queue_item, set_config, get_config
+from src.database import clear_platform_status, delete_from_queue, reschedule_queue_item, update_queue_status, get_queue_item, set_configs
 from src.scheduling import next_daily_slots
 from src.platform_registry import get_platforms
+from src.ui.cache import cached_config, cached_queue_dataframe, cached_schedule, cached_status_counts, queue_fingerprint, clear_config_cache, clear_queue_cache
 from src import ui_logic
 
 FORCE_KEY = "queue_force_run"
 FORCE_PLATFORM_KEY = "queue_force_platform"
+UPLOAD_POLL_SECONDS = 1
+_UPLOAD_JOB_KEY = "upload_job"
+# Batch saves run off the script thread so large drops do not freeze the page
+_UPLOAD_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="upload-save")
+# Substrings the uploaders write into platform_logs on a successful post
+_SUCCESS_MARKERS = ("success", "uploaded", "id:")
 
 
 def render_calendar_view(queue_rows):
     """Render a calendar view of scheduled uploads with gap detection."""
-    from src.scheduling import get_schedule
-
     st.markdown("### **Calendar View**")
 
     # Parse scheduled dates
@@ -38,7 +46,7 @@ def render_calendar_view(queue_rows):
         return
 
     # Get schedule config for gap detection
-    schedule = get_schedule()
+    schedule = cached_schedule()
     enabled_weekdays = set(schedule["days"])  # 0=Monday, 6=Sunday
 
     # Show next 21 days
@@ -107,17 +115,23 @@ def render_calendar_view(queue_rows):
             st.caption(f"... and {len(gaps) - 5} more")
 
 
+@lru_cache(maxsize=256)
+def _parse_logs_json(raw: str):
+    """Decode a platform_logs JSON string; memoized on the raw text so unchanged rows are parsed once."""
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return {}
+
+
 def _parse_platform_logs(log_value):
-    """Parse platform_logs from string or dict."""
+    """Parse platform_logs from string or dict. Treat the result as read-only."""
     if not log_value:
         return {}
     if isinstance(log_value, dict):
         return log_value
     if isinstance(log_value, str):
-        try:
-            return json.loads(log_value)
-        except json.JSONDecodeError:
-            return {}
+        return _parse_logs_json(log_value)
     return {}
 
 
@@ -126,8 +140,9 @@ def render_platform_status_row(row_id: int, platform_key: str, label: str, log_v
     logs = _parse_platform_logs(log_value)
     status_text = logs.get(platform_key, "")
     
-    # Determine status
-    is_success = "success" in str(status_text).lower() or "uploaded" in str(status_text).lower() or "id:" in str(status_text).lower()
+    # Determine status - one lowercase copy, short-circuiting on the first marker
+    status_lower = str(status_text).lower()
+    is_success = any(marker in status_lower for marker in _SUCCESS_MARKERS)
     is_failed = status_text and not is_success
     
     # Show status
@@ -150,25 +165,175 @@ def render_platform_status_row(row_id: int, platform_key: str, label: str, log_v
                 update_queue_status(row_id, "retry", None, current_logs)
                 
                 # Set force flag for this platform
-                set_config(FORCE_KEY, 1)
-                set_config(FORCE_PLATFORM_KEY, platform_key)
+                set_configs({FORCE_KEY: 1, FORCE_PLATFORM_KEY: platform_key})
                 logger.info("Manual force upload triggered for queue #%s, platform: %s", row_id, label)
                 st.success(f"Force {label} queued!")
+                clear_queue_cache()
+                clear_config_cache()
                 st.rerun()
             else:
                 logger.warning("Failed to clear platform status for queue #%s, platform: %s", row_id, label)
                 st.error("Failed to clear platform status")
 
 
-def render_queue_tab(queue_rows, uploaded_rows, UPLOAD_DIR, logger):
+_STATUS_LABELS = {"pending": "Pending", "processing": "Processing", "uploaded": "Done", "failed": "Failed", "retry": "Retry"}
+# Map platform keys to short labels
+_PLATFORM_SHORT_LABELS = {"youtube": "YT", "instagram": "IG", "tiktok": "TT"}
+
+
+def _enabled_platforms(row):
+    """Parse the row's enabled_platforms list; None means all platforms."""
+    raw_enabled = row.get("enabled_platforms")
+    if not raw_enabled:
+        return None
+    if not isinstance(raw_enabled, str):
+        return raw_enabled
+    try:
+        return json.loads(raw_enabled)
+    except json.JSONDecodeError:
+        return None
+
+
+def _queue_row_label(row) -> str:
+    """One-line label for the Manage selector, with platform indicators."""
+    icon = _STATUS_LABELS.get(row['status'], row['status'].title())
+    enabled_platforms_display = []
+    enabled_list = _enabled_platforms(row)
+    if enabled_list is not None:
+        try:
+            enabled_platforms_display = [_PLATFORM_SHORT_LABELS.get(p, p.upper()[:2]) for p in enabled_list]
+        except (AttributeError, TypeError):
+            pass
+    platform_indicator = f" [{'/'.join(enabled_platforms_display)}]" if enabled_platforms_display else ""
+    return f"{icon} #{row['id']} - {Path(row['file_path']).name[:25]}{platform_indicator}"
+
+
+def render_queue_item(row, queue_rows, occupied_all, tz, logger):
+    """Render the detail pane (info, platform status, actions, preview) for one queue row."""
+    platforms = get_platforms()
+    col_info, col_vid = st.columns([1, 1])
+
+    with col_info:
+        st.write(f"**{ui_logic.format_datetime_for_ui(row.get('scheduled_for'), tz)}**")
+        st.write(f"Status: {row['status']}")
+
+        # Show custom title/description if set
+        if row.get("title") and row.get("title") != cached_config("global_title", ""):
+            st.write(f"Title: {row['title'][:40]}...")
+        if row.get("description") and row.get("description") != cached_config("global_desc", ""):
+            st.write(f"Desc: {row['description'][:40]}...")
+        if row.get("last_error"):
+            st.error(row['last_error'][:50])
+
+        # Platform status section
+        st.markdown("**Platforms:**")
+
+        # Determine which platforms to show for this video
+        platforms_to_show = platforms.keys()
+        enabled_list = _enabled_platforms(row)
+        if enabled_list is not None:
+            try:
+                platforms_to_show = [p for p in platforms.keys() if p in enabled_list]
+            except TypeError:
+                pass
+
+        # Parse platform_logs once per row, not once per platform
+        row_logs = _parse_platform_logs(row.get("platform_logs"))
+        for pkey in platforms_to_show:
+            if pkey in platforms:
+                pcfg = platforms[pkey]
+                render_platform_status_row(
+                    row["id"],
+                    pkey,
+                    pcfg["label"],
+                    row_logs,
+                    row["file_path"],
+                    logger,
+                )
+
+        st.markdown("---")
+        ac1, ac2 = st.columns(2)
+        if ac1.button("Delete", key=f"del_{row['id']}"):
+            delete_from_queue(row["id"])
+            Path(row["file_path"]).unlink(missing_ok=True)
+            logger.info("Deleted queue item #%s from queue list", row["id"])
+            clear_queue_cache()
+            st.rerun()
+        if ac2.button("Reschedule", key=f"rsc_{row['id']}"):
+            anchor = ui_logic.parse_iso(row.get("scheduled_for")) or ui_logic.get_schedule_start_time(queue_rows)
+            occupied = set(occupied_all)
+            curr_dt = ui_logic.parse_iso(row.get("scheduled_for"))
+            if curr_dt:
+                occupied.discard(curr_dt.date().isoformat())
+            future = next_daily_slots(1, start=anchor, occupied_dates=occupied)
+            if future:
+                reschedule_queue_item(row["id"], future[0].isoformat())
+                logger.info("Rescheduled queue item #%s to %s", row["id"], future[0].isoformat())
+                st.success("Rescheduled!")
+                clear_queue_cache()
+                st.rerun()
+
+    with col_vid:
+        # Only the selected row is rendered, so a single stat is cheaper than listing the directory
+        if Path(row["file_path"]).exists():
+            # The player streams the file, so only load it on request
+            if st.checkbox("Show preview", value=False, key=f"prev_{row['id']}"):
+                st.video(str(row["file_path"]))
+        else:
+            logger.warning("File missing for queue item #%s: %s", row["id"], row["file_path"])
+            st.warning("File missing")
+
+
+def _uploads_signature(files, *extra: str) -> str:
+    """Short digest of the selected files (name + size) used to avoid double-queueing."""
+    h = hashlib.blake2b(digest_size=16)
+    for f in files:
+        h.update(f.name.encode())
+        h.update(b"\0")
+        h.update(str(getattr(f, "size", None)).encode())
+        h.update(b"\0")
+    for part in extra:
+        h.update(part.encode())
+    return h.hexdigest()
+
+
+@st.fragment(run_every=UPLOAD_POLL_SECONDS)
+def _poll_upload_job(logger):
+    """Wait for a background batch save; rerun the app once it finishes so the queue redraws."""
+    job = st.session_state.get(_UPLOAD_JOB_KEY)
+    if job is None:
+        return
+    future, sig, total = job
+    if not future.done():
+        st.info(f"Saving {total} videos...")
+        return
+    st.session_state.pop(_UPLOAD_JOB_KEY, None)
+    try:
+        count = future.result()
+    except Exception as e:
+        logger.error("Background queue save failed: %s", e)
+        count = 0
+    if count > 0:
+        logger.info("Queued %d videos for upload", count)
+        st.session_state["queued_sig"] = sig
+        clear_queue_cache()
+    st.rerun()
+
+
+def render_queue_tab(queue_rows, UPLOAD_DIR, logger):
     """Render upload queue."""
+    tz = ui_logic.resolve_timezone(cached_schedule()["timezone"])
+    # Dates already taken by active rows; shared by the upload and reschedule paths
+    occupied_all = ui_logic.occupied_schedule_dates(queue_rows)
 
     # Calendar view at top
     with st.expander("📅 Calendar View", expanded=False):
         render_calendar_view(queue_rows)
 
     # Quick actions
-    has_queue_items = any(row["status"] in ("pending", "retry") for row in queue_rows)
+    # Counts come from the cached GROUP BY query, so the render never scans queue_rows
+    counts = cached_status_counts()
+    has_queue_items = counts.get("pending", 0) + counts.get("retry", 0) > 0
     
     c1, c2 = st.columns(2)
     with c1:
@@ -176,17 +341,18 @@ def render_queue_tab(queue_rows, uploaded_rows, UPLOAD_DIR, logger):
             shuffled, _ = ui_logic.shuffle_queue(queue_rows)
             logger.info("Queue shuffled: %d items", shuffled)
             st.success(f"Shuffled {shuffled} items!")
+            clear_queue_cache()
             st.rerun()
     with c2:
         if st.button("Delete Next", key="delete_next_btn", type="secondary", disabled=not bool(queue_rows)):
+            # Rows are schedule-ordered, so the first match is the next one up
             next_item = next((row for row in queue_rows if row.get("status") in ("pending", "retry", "failed")), None)
             if next_item:
                 delete_from_queue(next_item["id"])
-                fp = Path(next_item["file_path"])
-                if fp.exists():
-                    fp.unlink(missing_ok=True)
+                Path(next_item["file_path"]).unlink(missing_ok=True)
                 logger.info("Deleted queue item #%s", next_item["id"])
                 st.success(f"Removed #{next_item['id']}")
+                clear_queue_cache()
                 st.rerun()
     
     # Upload section
@@ -197,11 +363,18 @@ def render_queue_tab(queue_rows, uploaded_rows, UPLOAD_DIR, logger):
         accept_multiple_files=True
     )
 
+    upload_running = _UPLOAD_JOB_KEY in st.session_state
+    if upload_running:
+        _poll_upload_job(logger)
+
     if uploaded_files:
         # Handle both single file and list
         if not isinstance(uploaded_files, list):
             uploaded_files = [uploaded_files]
 
+        # Anchor for new slots - computed once and shared by both modes
+        start_dt = ui_logic.get_schedule_start_time(queue_rows)
+
         # Single video = custom scheduling mode
         if len(uploaded_files) == 1:
             st.markdown("**Custom Video Settings**")
@@ -225,14 +398,14 @@ def render_queue_tab(queue_rows, uploaded_rows, UPLOAD_DIR, logger):
             # Custom title and description
             custom_title = st.text_input(
                 "Title (for YouTube)",
-                value=get_config("global_title", "Daily Short"),
+                value=cached_config("global_title", "Daily Short"),
                 max_chars=100,
                 key="custom_title_input"
             )
 
             custom_desc = st.text_area(
                 "Description",
-                value=get_config("global_desc", "#shorts"),
+                value=cached_config("global_desc", "#shorts"),
                 max_chars=2200,
                 key="custom_desc_input"
             )
@@ -242,13 +415,13 @@ def render_queue_tab(queue_rows, uploaded_rows, UPLOAD_DIR, logger):
             with col_date:
                 custom_date = st.date_input(
                     "Schedule Date",
-                    value=ui_logic.get_schedule_start_time(queue_rows).date(),
+                    value=start_dt.date(),
                     key="custom_date_input"
                 )
             with col_time:
                 custom_time = st.time_input(
                     "Schedule Time",
-                    value=ui_logic.get_schedule_start_time(queue_rows).time(),
+                    value=start_dt.time(),
                     key="custom_time_input"
                 )
 
@@ -257,18 +430,18 @@ def render_queue_tab(queue_rows, uploaded_rows, UPLOAD_DIR, logger):
             custom_datetime = datetime.combine(custom_date, custom_time)
 
             # Replace timezone info from schedule start time
-            start_dt = ui_logic.get_schedule_start_time(queue_rows)
             if start_dt.tzinfo:
                 custom_datetime = custom_datetime.replace(tzinfo=start_dt.tzinfo)
 
-            # Preview
-            st.video(uploaded_files[0])
+            # Preview on demand - st.video embeds the whole upload in the page
+            if st.checkbox("Show preview", value=False, key="custom_preview_toggle"):
+                st.video(uploaded_files[0])
 
             if st.button("Queue Video", key="queue_custom_video_btn", type="primary"):
                 if not enabled_platforms:
                     st.error("Please select at least one platform!")
                 else:
-                    sig = (uploaded_files[0].name, getattr(uploaded_files[0], "size", None), custom_datetime.isoformat())
+                    sig = _uploads_signature(uploaded_files[:1], custom_datetime.isoformat())
                     if st.session_state.get("queued_sig") != sig:
                         count = ui_logic.save_custom_video_to_queue(
                             uploaded_files[0],
@@ -282,12 +455,11 @@ def render_queue_tab(queue_rows, uploaded_rows, UPLOAD_DIR, logger):
                             logger.info("Queued custom video for %s", custom_datetime.isoformat())
                             st.session_state["queued_sig"] = sig
                             st.success(f"Video queued for {custom_datetime.strftime('%b %d, %Y at %H:%M')}!")
+                            clear_queue_cache()
                             st.rerun()
         else:
             # Multiple videos = batch mode with global settings
-            start_dt = ui_logic.get_schedule_start_time(queue_rows)
-            occupied = ui_logic.occupied_schedule_dates(queue_rows)
-            slots = next_daily_slots(len(uploaded_files), start=start_dt, occupied_dates=occupied)
+            slots = next_daily_slots(len(uploaded_files), start=start_dt, occupied_dates=occupied_all)
 
             if len(slots) < len(uploaded_files):
                 logger.warning("Not enough schedule slots for %d videos", len(uploaded_files))
@@ -295,23 +467,30 @@ def render_queue_tab(queue_rows, uploaded_rows, UPLOAD_DIR, logger):
             else:
                 st.markdown(f"**{len(uploaded_files)} videos** scheduled")
 
-                # Preview first 2
-                for uploaded in uploaded_files[:2]:
-                    st.video(uploaded)
+                # Preview first 2 on demand - st.video embeds the whole upload in the page
+                if st.checkbox("Show previews", value=False, key="batch_preview_toggle"):
+                    preview_cols = st.columns(2)
+                    for idx, uploaded in enumerate(uploaded_files[:2]):
+                        preview_cols[idx].video(uploaded)
+
+                # Format the slot list once per selection, not on every rerun
+                sig = _uploads_signature(uploaded_files)
+                slots_key = (sig, slots[0].isoformat(), slots[-1].isoformat())
+                if st.session_state.get("_slots_key") != slots_key:
+                    st.session_state["_slots_fmt"] = "\n".join(s.strftime("%b %d %H:%M") for s in slots)
+                    st.session_state["_slots_key"] = slots_key
 
                 # View schedule
                 with st.expander("Schedule"):
-                    st.write("\n".join(s.strftime("%b %d %H:%M") for s in slots))
+                    st.write(st.session_state["_slots_fmt"])
 
-                if st.button(f"Queue {len(uploaded_files)} Videos", key="queue_videos_btn", type="primary"):
-                    sig = tuple((f.name, getattr(f, "size", None)) for f in uploaded_files)
-                    if st.session_state.get("queued_sig") != sig:
-                        count = ui_logic.save_files_to_queue(uploaded_files, slots, UPLOAD_DIR, shuffle_order=False)
-                        if count > 0:
-                            logger.info("Queued %d videos for upload", count)
-                            st.session_state["queued_sig"] = sig
-                            st.success(f"Queued {count} videos!")
-                            st.rerun()
+                if st.button(f"Queue {len(uploaded_files)} Videos", key="queue_videos_btn", type="primary", disabled=upload_running):
+                    if st.session_state.get("queued_sig") != sig and not upload_running:
+                        future = _UPLOAD_POOL.submit(
+                            ui_logic.save_files_to_queue, list(uploaded_files), slots, UPLOAD_DIR, shuffle_order=False
+                        )
+                        st.session_state[_UPLOAD_JOB_KEY] = (future, sig, len(uploaded_files))
+                        st.rerun(scope="fragment")
     else:
         st.session_state.pop("queued_sig", None)
     
@@ -319,105 +498,22 @@ def render_queue_tab(queue_rows, uploaded_rows, UPLOAD_DIR, logger):
     st.markdown("### **Queue**")
     
     if queue_rows:
-        platforms = get_platforms()
-
-        for row in queue_rows:
-            status_icons = {"pending": "Pending", "processing": "Processing", "uploaded": "Done", "failed": "Failed", "retry": "Retry"}
-            icon = status_icons.get(row['status'], row['status'].title())
-
-            # Parse enabled platforms for display
-            enabled_platforms_display = []
-            raw_enabled = row.get("enabled_platforms")
-            if raw_enabled:
-                try:
-                    if isinstance(raw_enabled, str):
-                        enabled_platforms_list = json.loads(raw_enabled)
-                    else:
-                        enabled_platforms_list = raw_enabled
-
-                    # Map platform keys to emoji/short labels
-                    platform_labels = {
-                        "youtube": "YT",
-                        "instagram": "IG",
-                        "tiktok": "TT"
-                    }
-                    enabled_platforms_display = [platform_labels.get(p, p.upper()[:2]) for p in enabled_platforms_list]
-                except (json.JSONDecodeError, TypeError):
-                    pass
-
-            # Build title with platform indicators
-            platform_indicator = f" [{'/'.join(enabled_platforms_display)}]" if enabled_platforms_display else ""
-            expander_title = f"{icon} #{row['id']} - {Path(row['file_path']).name[:25]}{platform_indicator}"
-
-            with st.expander(expander_title):
-                col_info, col_vid = st.columns([1, 1])
-
-                with col_info:
-                    st.write(f"**{ui_logic.format_datetime_for_ui(row.get('scheduled_for'))}**")
-                    st.write(f"Status: {row['status']}")
-
-                    # Show custom title/description if set
-                    if row.get("title") and row.get("title") != get_config("global_title", ""):
-                        st.write(f"Title: {row['title'][:40]}...")
-                    if row.get("description") and row.get("description") != get_config("global_desc", ""):
-                        st.write(f"Desc: {row['description'][:40]}...")
-                    if row.get("last_error"):
-                        st.error(row['last_error'][:50])
-                    
-                    # Platform status section
-                    st.markdown("**Platforms:**")
-
-                    # Determine which platforms to show for this video
-                    platforms_to_show = platforms.keys()
-                    if raw_enabled:
-                        try:
-                            if isinstance(raw_enabled, str):
-                                enabled_list = json.loads(raw_enabled)
-                            else:
-                                enabled_list = raw_enabled
-                            platforms_to_show = [p for p in platforms.keys() if p in enabled_list]
-                        except (json.JSONDecodeError, TypeError):
-                            pass
-
-                    for pkey in platforms_to_show:
-                        if pkey in platforms:
-                            pcfg = platforms[pkey]
-                            render_platform_status_row(
-                                row["id"],
-                                pkey,
-                                pcfg["label"],
-                                row.get("platform_logs"),
-                                row["file_path"],
-                                logger,
-                            )
-                    
-                    st.markdown("---")
-                    ac1, ac2 = st.columns(2)
-                    if ac1.button("Delete", key=f"del_{row['id']}"):
-                        delete_from_queue(row["id"])
-                        fp = Path(row["file_path"])
-                        if fp.exists():
-                            fp.unlink(missing_ok=True)
-                        logger.info("Deleted queue item #%s from queue list", row["id"])
-                        st.rerun()
-                    if ac2.button("Reschedule", key=f"rsc_{row['id']}"):
-                        anchor = ui_logic.parse_iso(row.get("scheduled_for")) or ui_logic.get_schedule_start_time(queue_rows)
-                        occupied = ui_logic.occupied_schedule_dates(queue_rows)
-                        curr_dt = ui_logic.parse_iso(row.get("scheduled_for"))
-                        if curr_dt:
-                            occupied.discard(curr_dt.date().isoformat())
-                        future = next_daily_slots(1, start=anchor, occupied_dates=occupied)
-                        if future:
-                            reschedule_queue_item(row["id"], future[0].isoformat())
-                            logger.info("Rescheduled queue item #%s to %s", row["id"], future[0].isoformat())
-                            st.success("Rescheduled!")
-                            st.rerun()
-                
-                with col_vid:
-                    if Path(row["file_path"]).exists():
-                        st.video(str(row["file_path"]))
-                    else:
-                        logger.warning("File missing for queue item #%s: %s", row["id"], row["file_path"])
-                        st.warning("File missing")
+        st.dataframe(
+            cached_queue_dataframe(queue_fingerprint(queue_rows, cached_schedule()["timezone"]), queue_rows),
+            hide_index=True,
+        )
+
+        # Manage one item at a time: a single detail pane instead of an expander
+        # (and its widgets) for every row.
+        rows_by_id = {row["id"]: row for row in queue_rows}
+        labels = {row_id: _queue_row_label(row) for row_id, row in rows_by_id.items()}
+        selected_id = st.selectbox(
+            "Manage item",
+            options=list(labels),
+            format_func=labels.get,
+            key="queue_manage_select",
+        )
+        with st.container(border=True):
+            render_queue_item(rows_by_id[selected_id], queue_rows, occupied_all, tz, logger)
     else:
         st.info("No videos in queue")
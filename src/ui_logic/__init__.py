@@ -1,6 +1,8 @@
 # UI Logic Utilities
 from src.ui_logic.datetime_utils import (
     parse_iso,
+    resolve_timezone,
+    schedule_timezone,
     format_datetime_for_ui,
     format_uploaded_time,
 )
@@ -12,13 +14,17 @@ from src.ui_logic.scheduling_utils import (
 )
 from src.ui_logic.file_utils import (
     save_files_to_queue,
+    save_custom_video_to_queue,
     extract_tiktok_session,
     get_storage_summary,
+    existing_upload_paths,
     format_queue_dataframe,
 )
 
 __all__ = [
     "parse_iso",
+    "resolve_timezone",
+    "schedule_timezone",
     "format_datetime_for_ui",
     "format_uploaded_time",
     "get_schedule_start_time",
@@ -26,7 +32,9 @@ __all__ = [
     "shuffle_queue",
     "reschedule_pending_items",
     "save_files_to_queue",
+    "save_custom_video_to_queue",
     "extract_tiktok_session",
     "get_storage_summary",
+    "existing_upload_paths",
     "format_queue_dataframe",
 ]
@@ -1,7 +1,7 @@
-from datetime import datetime
+from datetime import datetime, tzinfo
 from typing import Optional
 import pytz
-from src.scheduling import get_schedule
+from src.scheduling import get_schedule, get_timezone
 
 
 def parse_iso(value: Optional[str]) -> Optional[datetime]:
@@ -14,17 +14,29 @@ def parse_iso(value: Optional[str]) -> Optional[datetime]:
         return None
 
 
-def format_datetime_for_ui(value: Optional[str]) -> str:
-    """Formats an ISO string into a human-readable local time string."""
+def resolve_timezone(tz_name: Optional[str]) -> tzinfo:
+    """Returns the cached tz object for a name, falling back to UTC if unknown."""
+    try:
+        return get_timezone(tz_name or "UTC")
+    except pytz.UnknownTimeZoneError:
+        return pytz.UTC
+
+
+def schedule_timezone() -> tzinfo:
+    """Returns the timezone configured in the publish schedule."""
+    return resolve_timezone(get_schedule().get("timezone", "UTC"))
+
+
+def format_datetime_for_ui(value: Optional[str], tz: Optional[tzinfo] = None) -> str:
+    """
+    Formats an ISO string into a human-readable local time string.
+    Pass `tz` when formatting many rows to skip the per-call schedule lookup.
+    """
     dt = parse_iso(value)
     if not dt:
         return "Not scheduled"
     
-    tz_name = get_schedule().get("timezone", "UTC")
-    try:
-        local_tz = pytz.timezone(tz_name)
-    except pytz.UnknownTimeZoneError:
-        local_tz = pytz.UTC
+    local_tz = tz or schedule_timezone()
 
     # Ensure dt is aware before converting
     if dt.tzinfo is None:
@@ -34,7 +46,7 @@ def format_datetime_for_ui(value: Optional[str]) -> str:
     return local_dt.strftime("%b %d, %Y %H:%M")
 
 
-def format_uploaded_time(value: Optional[str]) -> str:
+def format_uploaded_time(value: Optional[str], tz: Optional[tzinfo] = None) -> str:
     """
     Formats uploaded_at which may be ISO or SQLite-style 'YYYY-MM-DD HH:MM:SS'.
     """
@@ -46,11 +58,7 @@ def format_uploaded_time(value: Optional[str]) -> str:
             dt = datetime.fromisoformat(value.replace(" ", "T"))
         except Exception:
             return value
-    tz_name = get_schedule().get("timezone", "UTC")
-    try:
-        local_tz = pytz.timezone(tz_name)
-    except pytz.UnknownTimeZoneError:
-        local_tz = pytz.UTC
+    local_tz = tz or schedule_timezone()
     if dt.tzinfo is None:
         dt = pytz.utc.localize(dt)
     return dt.astimezone(local_tz).strftime("%b %d, %Y %H:%M")
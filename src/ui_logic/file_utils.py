@@ -1,17 +1,49 @@
 import json
 import logging
+import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Any, Tuple, Optional, Dict
+from typing import List, Any, Tuple, Optional, Dict, Set
 
 import pandas as pd
 
-from src.database import add_to_queue, get_config
+from src.database import add_many_to_queue, add_to_queue, get_configs
 from src.scheduling import next_daily_slots
 
 logger = logging.getLogger("ui_logic")
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+UPLOAD_WRITE_WORKERS = 4
+
+# Matches `sessionid=<value>` in a Cookie header, with or without a "Cookie:" prefix
+_SESSIONID_RE = re.compile(r"(?:^|[\s;:])sessionid\s*=\s*([^;\s]+)")
+
+
+def _write_upload(uploaded_file: Any, destination: Path) -> None:
+    """Streams an uploaded file to disk in fixed-size chunks to bound memory use."""
+    uploaded_file.seek(0)
+    with destination.open("wb", buffering=UPLOAD_CHUNK_SIZE) as f:
+        shutil.copyfileobj(uploaded_file, f, length=UPLOAD_CHUNK_SIZE)
+
+
+def _try_write_upload(uploaded_file: Any, destination: Path) -> bool:
+    """Writes one upload, removing any partial file on failure. Returns True on success."""
+    try:
+        _write_upload(uploaded_file, destination)
+        return True
+    except Exception as e:
+        logger.error("Failed to save file %s: %s", uploaded_file.name, e)
+        # Cleanup partial file
+        if destination.exists():
+            try:
+                destination.unlink()
+            except OSError:
+                pass
+        return False
+
 
 def save_files_to_queue(
     files: List[Any],
@@ -28,8 +60,9 @@ def save_files_to_queue(
     if not files or not slots:
         return 0
 
-    title = get_config("global_title", "Daily Short")
-    desc = get_config("global_desc", "#shorts")
+    cfg = get_configs({"global_title": "Daily Short", "global_desc": "#shorts"})
+    title = cfg["global_title"]
+    desc = cfg["global_desc"]
 
     # Zip stops at the shortest list, preventing index errors
     paired = list(zip(files, slots))
@@ -37,39 +70,63 @@ def save_files_to_queue(
     if shuffle_order:
         random.shuffle(paired)
 
-    success_count = 0
     base_timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
     sequence = 1
+    planned = []
+    # One directory listing instead of an exists() call per candidate name
+    taken = existing_upload_paths(upload_dir)
 
+    # Pick every destination name up front so the parallel writes never collide
     for uploaded_file, slot in paired:
         ext = Path(uploaded_file.name).suffix or ".mp4"
         destination = upload_dir / f"{base_timestamp}_{sequence:02d}{ext}"
 
         # Ensure uniqueness even if multiple uploads land in the same second
-        while destination.exists():
+        while os.path.normpath(destination) in taken:
             sequence += 1
             destination = upload_dir / f"{base_timestamp}_{sequence:02d}{ext}"
         sequence += 1
+        planned.append((uploaded_file, slot, destination))
+
+    # Disk writes are I/O bound, so overlap them on a small thread pool
+    with ThreadPoolExecutor(max_workers=min(UPLOAD_WRITE_WORKERS, len(planned))) as pool:
+        results = list(pool.map(lambda item: _try_write_upload(item[0], item[2]), planned))
+
+    entries = []
+    written: List[Path] = []
+    for (uploaded_file, slot, destination), ok in zip(planned, results):
+        if not ok:
+            continue
+        written.append(destination)
+        # None for enabled_platforms means all platforms enabled
+        entries.append({
+            "file_path": str(destination),
+            "scheduled_for": slot.isoformat(),
+            "title": title,
+            "description": desc,
+            "enabled_platforms": None,
+            "platform_overrides": None,
+        })
 
-        try:
-            with destination.open("wb") as f:
-                f.write(uploaded_file.getbuffer())
-
-            # Add to DB - None for enabled_platforms means all platforms enabled
-            add_to_queue(str(destination), slot.isoformat(), title, desc, enabled_platforms=None)
-            logger.info("Queued file %s for %s", destination.name, slot.isoformat())
-            success_count += 1
+    if not entries:
+        return 0
 
-        except Exception as e:
-            logger.error("Failed to save or queue file %s: %s", uploaded_file.name, e)
-            # Cleanup orphan file if DB insert failed
-            if destination.exists():
-                try:
-                    destination.unlink()
-                except OSError:
-                    pass
+    # One transaction (and one fsync) for the whole batch
+    try:
+        add_many_to_queue(entries)
+    except Exception as e:
+        logger.error("Failed to queue %d files: %s", len(entries), e)
+        # Cleanup orphan files if DB insert failed
+        for destination in written:
+            try:
+                destination.unlink()
+            except OSError:
+                pass
+        return 0
 
-    return success_count
+    for entry in entries:
+        logger.info("Queued file %s for %s", Path(entry["file_path"]).name, entry["scheduled_for"])
+    return len(entries)
 
 
 def save_custom_video_to_queue(
@@ -95,8 +152,7 @@ def save_custom_video_to_queue(
         sequence += 1
 
     try:
-        with destination.open("wb") as f:
-            f.write(uploaded_file.getbuffer())
+        _write_upload(uploaded_file, destination)
 
         # Convert enabled_platforms list to JSON string
         platforms_json = json.dumps(enabled_platforms) if enabled_platforms else None
@@ -131,7 +187,12 @@ def extract_tiktok_session(raw_value: str) -> str:
     
     raw = raw_value.strip()
 
-    # 1. Try parsing as JSON (common from browser extensions)
+    # 1. Cookie header (sessionid=XYZ; path=/...) - single regex scan
+    match = _SESSIONID_RE.search(raw)
+    if match:
+        return match.group(1)
+
+    # 2. Try parsing as JSON (common from browser extensions)
     if raw.startswith("{") or raw.startswith("["):
         try:
             data = json.loads(raw)
@@ -154,19 +215,6 @@ def extract_tiktok_session(raw_value: str) -> str:
         except json.JSONDecodeError:
             pass
 
-    # 2. Try parsing as Cookie Header (sessionid=XYZ; path=/...)
-    if "sessionid" in raw:
-        parts = raw.split(";")
-        for part in parts:
-            if "sessionid" in part:
-                key, _, val = part.partition("=")
-                key_clean = key.strip()
-                # Remove "Cookie:" prefix if present
-                if ":" in key_clean:
-                    key_clean = key_clean.split(":")[-1].strip()
-                if key_clean == "sessionid":
-                    return val.strip()
-
     # 3. Fallback: return raw if it looks like a simple ID (no spaces/brackets)
     if " " not in raw and ";" not in raw and "{" not in raw:
         return raw
@@ -189,22 +237,37 @@ def get_storage_summary(data_dir: Path) -> Tuple[Optional[float], Optional[float
         return None, None, None, None
 
 
+def existing_upload_paths(upload_dir: Path) -> Set[str]:
+    """Returns the normalized paths of every file in upload_dir from a single scandir."""
+    try:
+        with os.scandir(upload_dir) as entries:
+            return {os.path.normpath(entry.path) for entry in entries if entry.is_file()}
+    except OSError as exc:
+        logger.warning("Unable to list upload directory %s: %s", upload_dir, exc)
+        return set()
+
+
 def format_queue_dataframe(queue_rows: List[Dict[str, Any]]) -> pd.DataFrame:
     """Converts raw DB rows into a clean Pandas DataFrame for the UI."""
-    from src.ui_logic.datetime_utils import format_datetime_for_ui
-    
-    data = []
+    from src.ui_logic.datetime_utils import format_datetime_for_ui, schedule_timezone
+
+    tz = schedule_timezone()
+
+    # Build each column in one pass instead of a dict per row
+    ids, files, scheduled, statuses, attempts, errors = [], [], [], [], [], []
     for row in queue_rows:
-        data.append({
-            "ID": row["id"],
-            "File": Path(row["file_path"]).name,
-            "Scheduled": format_datetime_for_ui(row.get("scheduled_for")),
-            "Status": row.get("status"),
-            "Attempts": row.get("attempts", 0),
-            "Last Error": row.get("last_error") or "",
-        })
-    
-    columns = ["ID", "File", "Scheduled", "Status", "Attempts", "Last Error"]
-    if not data:
-        return pd.DataFrame(columns=columns)
-    return pd.DataFrame(data)
+        ids.append(row["id"])
+        files.append(Path(row["file_path"]).name)
+        scheduled.append(format_datetime_for_ui(row.get("scheduled_for"), tz))
+        statuses.append(row.get("status"))
+        attempts.append(row.get("attempts", 0))
+        errors.append(row.get("last_error") or "")
+
+    return pd.DataFrame({
+        "ID": ids,
+        "File": files,
+        "Scheduled": scheduled,
+        "Status": statuses,
+        "Attempts": attempts,
+        "Last Error": errors,
+    })
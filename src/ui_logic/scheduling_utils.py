@@ -4,7 +4,7 @@ from typing import List, Optional, Dict, Any, Set, Tuple
 import pytz
 from src.database import reschedule_queue_item, update_queue_status
 from src.scheduling import get_schedule, next_daily_slots
-from src.ui_logic.datetime_utils import parse_iso
+from src.ui_logic.datetime_utils import parse_iso, resolve_timezone
 
 
 def get_schedule_start_time(queue_rows: List[Dict[str, Any]]) -> datetime:
@@ -13,31 +13,31 @@ def get_schedule_start_time(queue_rows: List[Dict[str, Any]]) -> datetime:
     Returns the later of 'now' or the 'latest scheduled item'.
     """
     cfg = get_schedule()
-    try:
-        tz = pytz.timezone(cfg.get("timezone", "UTC"))
-    except pytz.UnknownTimeZoneError:
-        tz = pytz.UTC
+    tz = resolve_timezone(cfg.get("timezone", "UTC"))
         
     now = datetime.now(tz)
-    
-    scheduled_times = []
+
+    # Track the running max in one pass; starting from now also covers
+    # "latest scheduled item is in the past".
+    latest = now
     for row in queue_rows:
         if row.get("status") in ("uploaded", "failed"):
             continue # Ignore completed/failed items for future scheduling anchor
-            
-        dt = parse_iso(row.get("scheduled_for"))
-        if dt:
-            # Ensure the parsed time is timezone-aware for comparison
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=tz)
-            scheduled_times.append(dt)
 
-    if not scheduled_times:
-        return now
+        value = row.get("scheduled_for")
+        if not value:
+            continue
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            continue
+        # Ensure the parsed time is timezone-aware for comparison
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=tz)
+        if dt > latest:
+            latest = dt
 
-    latest_scheduled = max(scheduled_times)
-    # If the latest scheduled item is in the past, start from now
-    return max(latest_scheduled, now)
+    return latest
 
 
 def occupied_schedule_dates(queue_rows: List[Dict[str, Any]]) -> Set[str]:
@@ -68,10 +68,7 @@ def shuffle_queue(queue_rows: List[Dict[str, Any]]) -> Tuple[int, Optional[datet
         return 0, None
 
     cfg = get_schedule()
-    try:
-        tz = pytz.timezone(cfg.get("timezone", "UTC"))
-    except pytz.UnknownTimeZoneError:
-        tz = pytz.UTC
+    tz = resolve_timezone(cfg.get("timezone", "UTC"))
 
     # Start from NOW, not from the latest scheduled time (which pushes items further)
     anchor = datetime.now(tz)
@@ -119,10 +116,7 @@ def reschedule_pending_items(
         return 0, None
 
     cfg = get_schedule()
-    try:
-        tz = pytz.timezone(cfg.get("timezone", "UTC"))
-    except pytz.UnknownTimeZoneError:
-        tz = pytz.UTC
+    tz = resolve_timezone(cfg.get("timezone", "UTC"))
 
     anchor = start or datetime.now(tz)
     if anchor.tzinfo is None: